@@ -1,6 +1,8 @@
 """Configuration management for Open Video Transcribe."""
 from __future__ import annotations
 
+import copy
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
@@ -10,6 +12,13 @@ from core.exceptions import ConfigurationError
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Sentinel for keys that are not present in the config
+_MISSING = object()
+
 
 class ConfigManager:
     """Manages application configuration."""
@@ -33,6 +42,14 @@ class ConfigManager:
         "output": {
             "format": "txt",
             "save_location": "same_as_input"
+        },
+        "audio": {
+            "keep_extracted": True
+        },
+        "transcription": {
+            "beam_size": 5,
+            "vad_filter": True,
+            "condition_on_previous_text": False
         }
     }
     
@@ -47,16 +64,20 @@ class ConfigManager:
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
+        return self._get_cached().copy()
+    
+    def _get_cached(self) -> Dict[str, Any]:
+        """Return the cached configuration without copying (read-only use)."""
         if self._config_cache is None:
             self._config_cache = self._load_from_file()
-        return self._config_cache.copy()
+        return self._config_cache
     
     def _load_from_file(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
             if self._config_path.exists():
                 with self._config_path.open() as f:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=_YamlLoader) or {}
             else:
                 logger.info("Config file not found, using defaults")
                 config = {}
@@ -67,67 +88,144 @@ class ConfigManager:
             logger.error(f"Unexpected error loading config: {e}")
             config = {}
         
-        merged_config = self.DEFAULT_CONFIG.copy()
+        # Deep copy so merging never mutates the nested DEFAULT_CONFIG dicts
+        merged_config = copy.deepcopy(self.DEFAULT_CONFIG)
         self._deep_update(merged_config, config)
         return merged_config
     
     def save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file."""
+        if config is not self._config_cache:
+            config = config.copy()
+        self._flush_to_disk(config)
+    
+    def _flush_to_disk(self, config: Dict[str, Any]) -> None:
+        """Write config to disk and make it the cache (no copy)."""
+        # Write to a sibling temp file and rename so a crash never leaves a torn config
+        tmp_path = self._config_path.with_name(self._config_path.name + ".tmp")
         try:
             self._config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with self._config_path.open("w") as f:
-                yaml.safe_dump(config, f, sort_keys=False, default_flow_style=False)
+            with tmp_path.open("w") as f:
+                yaml.dump(config, f, Dumper=_YamlDumper, sort_keys=False, default_flow_style=False)
+            os.replace(tmp_path, self._config_path)
             
-            self._config_cache = config.copy()
+            self._config_cache = config
             logger.debug("Configuration saved successfully")
             
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             raise ConfigurationError(f"Failed to save configuration: {e}") from e
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """Update configuration with new values."""
-        config = self.load_config()
+        # Merged into a copy: the cache only changes once the write has succeeded
+        config = copy.deepcopy(self._get_cached())
         self._deep_update(config, updates)
-        self.save_config(config)
+        self._flush_to_disk(config)
     
     def get_value(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key (supports dot notation)."""
-        config = self.load_config()
-        keys = key.split(".")
-        value = config
-        for k in keys:
+        value = self._get_cached()
+        for k in key.split("."):
             if isinstance(value, dict):
                 value = value.get(k, default)
             else:
                 return default
         return value if value is not None else default
     
+    def snapshot(self) -> Dict[str, Any]:
+        """Return every leaf value in the config under its dot-notation key.
+        
+        Lets dialogs read many settings from a single view with ``dict.get``.
+        As with ``get_value``, keys whose value is None are omitted so that
+        ``snapshot().get(key, default)`` falls back to ``default``.
+        
+        Returns:
+            Flat mapping such as ``{"model.quantization": "float16", ...}``
+        """
+        flat: Dict[str, Any] = {}
+        stack = [("", self._get_cached())]
+        while stack:
+            prefix, node = stack.pop()
+            for k, v in node.items():
+                key = f"{prefix}{k}"
+                if isinstance(v, dict):
+                    stack.append((f"{key}.", v))
+                elif v is not None:
+                    flat[key] = v
+        return flat
+    
     def set_value(self, key: str, value: Any) -> None:
-        """Set a configuration value by key (supports dot notation)."""
-        config = self.load_config()
-        keys = key.split(".")
-        target = config
-        for k in keys[:-1]:
-            if k not in target:
-                target[k] = {}
-            target = target[k]
-        target[keys[-1]] = value
-        self.save_config(config)
+        """Set a configuration value by key (supports dot notation).
+        
+        Skips the disk write when the stored value already equals ``value``.
+        """
+        self.update_values({key: value})
+    
+    def update_values(self, pairs: Dict[str, Any]) -> None:
+        """Set several dot-notation keys at once and save the file a single time.
+        
+        Args:
+            pairs: Mapping of dot-notation keys to new values
+        """
+        cached = self._get_cached()
+        changed = {
+            key: value for key, value in pairs.items()
+            if self._lookup(cached, key) != value
+        }
+        if not changed:
+            return
+        
+        # Copy only the dicts along each changed path; the cache is swapped for
+        # the new config only once _flush_to_disk has written it
+        config = dict(cached)
+        copied = {id(config)}
+        for key, value in changed.items():
+            keys = key.split(".")
+            target = config
+            for k in keys[:-1]:
+                child = target.get(k)
+                if not isinstance(child, dict):
+                    child = {}
+                elif id(child) not in copied:
+                    child = dict(child)
+                copied.add(id(child))
+                target[k] = child
+                target = child
+            target[keys[-1]] = value
+        self._flush_to_disk(config)
     
     def invalidate_cache(self) -> None:
         """Invalidate the configuration cache."""
         self._config_cache = None
     
+    @staticmethod
+    def _lookup(config: Dict[str, Any], key: str) -> Any:
+        """Walk a dot-notation key; returns _MISSING if any level is absent."""
+        value: Any = config
+        for k in key.split("."):
+            if not isinstance(value, dict) or k not in value:
+                return _MISSING
+            value = value[k]
+        return value
+    
     @staticmethod
     def _deep_update(base_dict: Dict[str, Any], update_dict: Dict[str, Any]) -> None:
-        """Recursively update a dictionary."""
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                ConfigManager._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        """Merge update_dict into base_dict in place, descending into nested dicts."""
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, updates = stack.pop()
+            for key, value in updates.items():
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
 
 
 config_manager = ConfigManager()
@@ -0,0 +1,26 @@
+"""Platform facts shared by the install helpers, computed once per process."""
+from __future__ import annotations
+
+import functools
+import os
+import platform
+from pathlib import Path
+
+# platform.system() runs uname() on every call; resolve it once at import
+IS_WINDOWS: bool = platform.system() == "Windows"
+
+# Repository root (parent of the core package)
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=1)
+def get_venv_python() -> Path | None:
+    """Get path to venv Python executable (relative to project root).
+
+    Cached for the process; call get_venv_python.cache_clear() if the venv changes.
+    """
+    if IS_WINDOWS:
+        venv_python = PROJECT_ROOT / "venv" / "Scripts" / "python.exe"
+    else:
+        venv_python = PROJECT_ROOT / "venv" / "bin" / "python"
+    return venv_python if os.path.exists(venv_python) else None
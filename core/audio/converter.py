@@ -1,21 +1,74 @@
 """FFmpeg video-to-audio converter."""
 from __future__ import annotations
 
+import json
+import re
 import subprocess
+import threading
+import time
+import wave
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Any, Callable, Dict, Optional
 
 from core.logging_config import get_logger
 from core.exceptions import FFmpegError
+from core.models.base import PcmAudio, PCM_SAMPLE_RATE
 
 logger = get_logger(__name__)
 
+# Matches "Duration: HH:MM:SS.xx" (groups 1-3) or "time=HH:MM:SS.xx" (groups 4-6)
+_PROGRESS_RE = re.compile(
+    rb"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)|time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)"
+)
+
+# Minimum progress step / interval between progress_callback invocations
+_PROGRESS_MIN_STEP = 0.005
+_PROGRESS_MIN_INTERVAL = 0.1
+
+# Buffer size for FFmpeg pipes (binary mode, no line buffering or newline translation)
+_PIPE_BUFFER_SIZE = 65536
+
+# Bytes per stdout read when decoding to PCM (1 second of 16 kHz mono s16le)
+_PCM_READ_SIZE = PCM_SAMPLE_RATE * 2
+
+
+def read_pcm_wav(wav_path: Path) -> Optional[PcmAudio]:
+    """Load a 16 kHz mono s16le WAV straight into memory, or return None.
+    
+    Uses the WAV header only (no ffprobe/ffmpeg); any other layout returns None
+    so the caller can fall back to a decoding path.
+    
+    Args:
+        wav_path: Path to a .wav file
+        
+    Returns:
+        PcmAudio with float32 samples in [-1.0, 1.0], or None if not whisper-ready
+    """
+    import numpy as np
+    
+    try:
+        with wave.open(str(wav_path), "rb") as wav:
+            if (
+                wav.getnchannels() != 1
+                or wav.getsampwidth() != 2
+                or wav.getframerate() != PCM_SAMPLE_RATE
+                or wav.getcomptype() != "NONE"
+            ):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (OSError, EOFError, wave.Error) as e:
+        logger.debug(f"Not a whisper-ready WAV ({wav_path}): {e}")
+        return None
+    
+    samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    return PcmAudio(samples=samples, source=Path(wav_path))
+
 
 class FFmpegConverter:
     """Converts video files to audio using FFmpeg."""
     
-    SUPPORTED_VIDEO_FORMATS = [".mp4", ".avi", ".mkv", ".webm", ".mov", ".flv", ".wmv", ".m4v"]
-    SUPPORTED_AUDIO_FORMATS = [".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"]
+    SUPPORTED_VIDEO_FORMATS = frozenset({".mp4", ".avi", ".mkv", ".webm", ".mov", ".flv", ".wmv", ".m4v"})
+    SUPPORTED_AUDIO_FORMATS = frozenset({".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"})
     
     def __init__(self, ffmpeg_path: str):
         """Initialize converter with FFmpeg path.
@@ -46,6 +99,22 @@ class FFmpegConverter:
         except Exception as e:
             raise FFmpegError(f"FFmpeg validation error: {e}") from e
     
+    @classmethod
+    def classify_suffix(cls, suffix: str) -> Optional[str]:
+        """Classify a file extension as "video", "audio" or None.
+        
+        Accepts suffixes with or without the leading dot (".mp4" or "mp4"), so
+        callers holding plain path strings need not build a Path first.
+        """
+        suffix = suffix.lower()
+        if not suffix.startswith("."):
+            suffix = "." + suffix
+        if suffix in cls.SUPPORTED_VIDEO_FORMATS:
+            return "video"
+        if suffix in cls.SUPPORTED_AUDIO_FORMATS:
+            return "audio"
+        return None
+    
     def is_video_file(self, file_path: Path) -> bool:
         """Check if file is a supported video format."""
         return file_path.suffix.lower() in self.SUPPORTED_VIDEO_FORMATS
@@ -54,6 +123,49 @@ class FFmpegConverter:
         """Check if file is a supported audio format."""
         return file_path.suffix.lower() in self.SUPPORTED_AUDIO_FORMATS
     
+    def probe_stream(self, file_path: Path) -> Dict[str, Any]:
+        """Return the first audio stream as reported by ffprobe, or {} if unavailable.
+        
+        ffprobe is looked up next to the configured FFmpeg executable.
+        """
+        ffprobe_path = self.ffmpeg_path.with_name(
+            self.ffmpeg_path.name.replace("ffmpeg", "ffprobe", 1)
+        )
+        if ffprobe_path == self.ffmpeg_path or not ffprobe_path.exists():
+            return {}
+        
+        try:
+            result = subprocess.run(
+                [
+                    str(ffprobe_path),
+                    "-v", "error",
+                    "-select_streams", "a:0",
+                    "-show_streams",
+                    "-of", "json",
+                    str(file_path),
+                ],
+                capture_output=True,
+                timeout=10
+            )
+            if result.returncode != 0:
+                return {}
+            streams = json.loads(result.stdout).get("streams") or []
+            return streams[0] if streams else {}
+        except (subprocess.TimeoutExpired, OSError, ValueError) as e:
+            logger.debug(f"ffprobe failed for {file_path}: {e}")
+            return {}
+    
+    def _is_whisper_ready_wav(self, file_path: Path) -> bool:
+        """Check whether a file is already a 16 kHz mono s16le WAV."""
+        if file_path.suffix.lower() != ".wav":
+            return False
+        stream = self.probe_stream(file_path)
+        return (
+            stream.get("codec_name") == "pcm_s16le"
+            and str(stream.get("sample_rate")) == "16000"
+            and stream.get("channels") == 1
+        )
+    
     def convert_video_to_audio(
         self,
         video_path: Path,
@@ -113,14 +225,13 @@ class FFmpegConverter:
         codec = codec_map.get(audio_format, "pcm_s16le")
 
         try:
-            cmd = [
-                str(self.ffmpeg_path),
-                "-i", str(video_path),
-                "-vn",
-                "-acodec", codec,
-                "-ar", "16000",
-                "-ac", "1",
-            ]
+            cmd = self._input_args(video_path)
+            if audio_format == "wav" and self._is_whisper_ready_wav(video_path):
+                # Already 16 kHz mono PCM: copy samples instead of decoding/resampling
+                logger.info(f"Input is 16 kHz mono PCM, using stream copy: {video_path}")
+                cmd.extend(["-c", "copy"])
+            else:
+                cmd.extend(["-acodec", codec, "-ar", "16000", "-ac", "1"])
             
             # Add duration limit if specified (for test mode)
             if duration_limit is not None:
@@ -130,60 +241,17 @@ class FFmpegConverter:
             
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=_PIPE_BUFFER_SIZE,
             )
             
-            duration = None
-            current_time = None
-            stderr_lines: list[str] = []
-            
-            for line in iter(process.stderr.readline, ''):
-                if not line:
-                    break
-                stderr_lines.append(line)
-                
-                if "Duration:" in line:
-                    try:
-                        time_str = line.split("Duration:")[1].split(",")[0].strip()
-                        parts = time_str.split(":")
-                        duration = float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-                    except (IndexError, ValueError):
-                        pass
-                
-                if "time=" in line:
-                    try:
-                        time_str = line.split("time=")[1].split()[0]
-                        parts = time_str.split(":")
-                        current_time = float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2])
-                        if duration and progress_callback:
-                            progress = min(current_time / duration, 0.99)  # Cap at 99% until complete
-                            progress_callback(progress)
-                    except (IndexError, ValueError):
-                        pass
-                
-                # Also check for frame-based progress (alternative format)
-                if "frame=" in line and "fps=" in line:
-                    # This is a fallback if time-based progress doesn't work
-                    if duration and progress_callback:
-                        # Try to extract frame info (rough estimate)
-                        try:
-                            # This is a fallback - we'll use time-based primarily
-                            pass
-                        except (IndexError, ValueError):
-                            pass
-            
-            # Ensure we show 100% when complete
-            if duration and progress_callback:
-                progress_callback(1.0)
-            
+            stderr_output = self._read_progress(process.stderr, progress_callback)
             process.wait()
             
             if process.returncode != 0:
-                error_output = "".join(stderr_lines).strip() or f"Exit code {process.returncode}"
+                error_output = stderr_output.strip() or f"Exit code {process.returncode}"
                 raise FFmpegError(f"FFmpeg conversion failed: {error_output}")
             
             if not output_path.exists():
@@ -197,4 +265,148 @@ class FFmpegConverter:
         except Exception as e:
             logger.exception("Video conversion failed")
             raise FFmpegError(f"Video conversion error: {e}") from e
-
+    
+    def decode_to_pcm(
+        self,
+        input_path: Path,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        duration_limit: Optional[float] = None
+    ) -> PcmAudio:
+        """Decode a video/audio file to 16 kHz mono samples without writing a file.
+        
+        FFmpeg writes raw s16le PCM to a pipe which is read straight into memory.
+        
+        Args:
+            input_path: Path to video or audio file
+            progress_callback: Optional callback for progress (0.0-1.0)
+            duration_limit: Optional duration limit in seconds (e.g., 300 for 5 minutes)
+            
+        Returns:
+            PcmAudio with float32 samples in [-1.0, 1.0]
+        """
+        import numpy as np
+        
+        input_path = Path(input_path)
+        if not input_path.exists():
+            raise FFmpegError(f"File not found: {input_path}")
+        if not (self.is_video_file(input_path) or self.is_audio_file(input_path)):
+            raise FFmpegError(f"Unsupported file format: {input_path.suffix}")
+        
+        logger.info(f"Decoding {input_path} to in-memory PCM")
+        
+        try:
+            cmd = [
+                *self._input_args(input_path),
+                "-f", "s16le",
+                "-acodec", "pcm_s16le",
+                "-ar", str(PCM_SAMPLE_RATE),
+                "-ac", "1",
+            ]
+            if duration_limit is not None:
+                cmd.extend(["-t", str(duration_limit)])
+            cmd.append("pipe:1")
+            
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=_PIPE_BUFFER_SIZE,
+            )
+            
+            # Drain stderr on a helper thread so neither pipe can fill up and block FFmpeg
+            stderr_result: list[str] = []
+            stderr_thread = threading.Thread(
+                target=lambda: stderr_result.append(
+                    self._read_progress(process.stderr, progress_callback)
+                ),
+                daemon=True,
+            )
+            stderr_thread.start()
+            
+            pcm_chunks: list[bytes] = []
+            while True:
+                chunk = process.stdout.read(_PCM_READ_SIZE)
+                if not chunk:
+                    break
+                pcm_chunks.append(chunk)
+            
+            process.wait()
+            stderr_thread.join()
+            
+            if process.returncode != 0:
+                error_output = (stderr_result[0] if stderr_result else "").strip()
+                raise FFmpegError(
+                    f"FFmpeg decoding failed: {error_output or f'Exit code {process.returncode}'}"
+                )
+            
+            samples = np.frombuffer(b"".join(pcm_chunks), dtype=np.int16)
+            samples = samples.astype(np.float32) / 32768.0
+            
+            logger.info(f"Decoded {len(samples) / PCM_SAMPLE_RATE:.1f}s of audio from {input_path}")
+            return PcmAudio(samples=samples, source=input_path)
+            
+        except FFmpegError:
+            raise
+        except Exception as e:
+            logger.exception("PCM decoding failed")
+            raise FFmpegError(f"PCM decoding error: {e}") from e
+    
+    def _input_args(self, input_path: Path) -> list[str]:
+        """Build the FFmpeg command prefix that demuxes only the first audio stream.
+        
+        Mapping 0:a:0 keeps FFmpeg from decoding video packets at all (no -vn needed).
+        """
+        return [
+            str(self.ffmpeg_path),
+            "-fflags", "+discardcorrupt",
+            "-i", str(input_path),
+            "-map", "0:a:0?",
+            "-threads", "0",
+            "-avoid_negative_ts", "make_zero",
+        ]
+    
+    @staticmethod
+    def _read_progress(
+        stream,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Read FFmpeg stderr to EOF, reporting progress. Returns the decoded output."""
+        duration = None
+        stderr_chunks: list[bytes] = []
+        pending = b""
+        last_emitted_progress = -1.0
+        last_emit_ts = 0.0
+        
+        # FFmpeg terminates progress lines with \r, so split on both \r and \n
+        while True:
+            chunk = stream.read1(_PIPE_BUFFER_SIZE)
+            if not chunk:
+                break
+            stderr_chunks.append(chunk)
+            pending += chunk
+            cut = max(pending.rfind(b"\r"), pending.rfind(b"\n"))
+            if cut < 0:
+                continue
+            complete, pending = pending[:cut], pending[cut + 1:]
+            
+            for match in _PROGRESS_RE.finditer(complete):
+                if match.group(1) is not None:
+                    h, m, sec = match.group(1, 2, 3)
+                    duration = int(h) * 3600 + int(m) * 60 + float(sec)
+                elif duration and progress_callback:
+                    h, m, sec = match.group(4, 5, 6)
+                    current_time = int(h) * 3600 + int(m) * 60 + float(sec)
+                    progress = min(current_time / duration, 0.99)  # Cap at 99% until complete
+                    now = time.monotonic()
+                    if (progress - last_emitted_progress >= _PROGRESS_MIN_STEP
+                            or now - last_emit_ts > _PROGRESS_MIN_INTERVAL):
+                        progress_callback(progress)
+                        last_emitted_progress = progress
+                        last_emit_ts = now
+        
+        # Ensure we show 100% when complete
+        if duration and progress_callback:
+            progress_callback(1.0)
+        
+        return b"".join(stderr_chunks).decode("utf-8", errors="replace")
@@ -1,14 +1,15 @@
 """Main controller/orchestrator for Open Video Transcribe."""
 from __future__ import annotations
 
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 
 from PySide6.QtCore import QObject, Signal, Slot
 
 from config.manager import config_manager
 from core.models.registry import model_registry
-from core.models.base import TranscriptionAdapter, TranscriptionResult
+from core.models.base import TranscriptionAdapter, TranscriptionResult, PcmAudio
 from core.audio.converter import FFmpegConverter
 from core.transcription.service import TranscriptionService
 from core.transcription.progress import ProgressInfo
@@ -37,10 +38,25 @@ class Controller(QObject):
         self.transcription_service = TranscriptionService()
         
         self.current_language: Optional[str] = None
+        self.beam_size: int = 5
         self.current_model_type: Optional[str] = None
         self.current_model_name: Optional[str] = None
         self.current_input_file: Optional[Path] = None
         self._lyrics_mode: bool = False
+        # (model_type, model_name, quantization, device) to load once the GUI is up;
+        # loading is left to the caller so construction stays fast
+        self.startup_model: Tuple[str, str, str, str] = ("whisper", "large-v3", "float16", "cpu")
+        # False when startup_model differs from config only for this session
+        self.startup_persist = True
+        
+        # Output settings mirrored from config (see reload_output_settings)
+        self._output_format: str = "txt"
+        self._save_location: str = "same_as_input"
+        self._include_timestamps: bool = True
+        
+        # Rendered output formats for the most recent result (see _render_transcription)
+        self._rendered_result: Optional[TranscriptionResult] = None
+        self._rendered_cache: Dict[Tuple[str, bool], str] = {}
         
         self._connect_signals()
         self._load_settings()
@@ -58,6 +74,8 @@ class Controller(QObject):
     
     def _load_settings(self) -> None:
         """Load settings from config."""
+        self.reload_output_settings()
+        
         ffmpeg_path = config_manager.get_value("ffmpeg_path", "")
         if ffmpeg_path:
             try:
@@ -69,19 +87,28 @@ class Controller(QObject):
         model_name = config_manager.get_value("model.name", "large-v3")
         quantization = config_manager.get_value("model.quantization", "float16")
         device = config_manager.get_value("model.device", "cuda")
-        # Auto-enable CUDA at startup when GPU is available
+        # Auto-enable CUDA at startup when GPU is available (persisted by load_model)
         if self.cuda_available and device == "cpu":
             device = "cuda"
-            config_manager.set_value("model.device", "cuda")
+        # No usable GPU (or CPU forced via --cpu): start on CPU for this session only;
+        # startup_persist keeps load_model from saving "cpu" over the configured device
+        self.startup_persist = True
+        if not self.cuda_available and device == "cuda":
+            device = "cpu"
+            self.startup_persist = False
         
         self.current_language = config_manager.get_value("languages.input", "auto")
         if self.current_language == "auto":
             self.current_language = None
+        self.beam_size = config_manager.get_value("transcription.beam_size", 5)
         
-        try:
-            self.load_model(model_type, model_name, quantization, device)
-        except Exception as e:
-            logger.warning(f"Failed to load model from config: {e}")
+        self.startup_model = (model_type, model_name, quantization, device)
+    
+    def reload_output_settings(self) -> None:
+        """Refresh cached output settings from config (call after settings change)."""
+        self._output_format = config_manager.get_value("output.format", "txt")
+        self._save_location = config_manager.get_value("output.save_location", "same_as_input")
+        self._include_timestamps = config_manager.get_value("output.include_timestamps", True)
     
     def set_ffmpeg_path(self, path: str) -> None:
         """Set FFmpeg path and validate."""
@@ -100,9 +127,18 @@ class Controller(QObject):
         model_type: str,
         model_name: str,
         quantization: str,
-        device: str
+        device: str,
+        persist: bool = True,
     ) -> bool:
-        """Load a transcription model. Returns True on success, False on failure."""
+        """Load a transcription model. Returns True on success, False on failure.
+        
+        Args:
+            model_type: Registered model type (e.g. "whisper")
+            model_name: Model id
+            quantization: Quantization / compute type
+            device: "cuda" or "cpu"
+            persist: Save the selection to config on success
+        """
         self.widgets_enabled.emit(False)
         self.status_updated.emit(f"Loading model {model_name}...")
         
@@ -112,15 +148,21 @@ class Controller(QObject):
                 raise TranscriptionError(f"Unknown model type: {model_type}")
             
             adapter.load_model(model_name, device, quantization=quantization)
+            # Still on the loading thread: the one-off kernel warm-up must not
+            # queue in front of the first real transcription on the same model
+            adapter.warm_up()
             
             self.adapter = adapter
             self.current_model_type = model_type
             self.current_model_name = model_name
             
-            config_manager.set_value("model.type", model_type)
-            config_manager.set_value("model.name", model_name)
-            config_manager.set_value("model.quantization", quantization)
-            config_manager.set_value("model.device", device)
+            if persist:
+                config_manager.update_values({
+                    "model.type": model_type,
+                    "model.name": model_name,
+                    "model.quantization": quantization,
+                    "model.device": device,
+                })
             
             logger.info(f"Model loaded: {model_name} on {device}")
             self.status_updated.emit(f"Model {model_name} ready")
@@ -174,9 +216,12 @@ class Controller(QObject):
             self.current_input_file = None
             self._lyrics_mode = False
     
-    def _prepare_audio(self, file_path: Path, test_mode: bool = False) -> Path:
+    def _prepare_audio(self, file_path: Path, test_mode: bool = False) -> Union[Path, PcmAudio]:
         """Prepare audio file from video or return existing audio.
         
+        When ``audio.keep_extracted`` is False and the adapter accepts PCM input,
+        FFmpeg output is decoded into memory instead of being written to disk.
+        
         Args:
             file_path: Path to video or audio file
             test_mode: If True, limit to first 5 minutes (300 seconds)
@@ -186,8 +231,27 @@ class Controller(QObject):
         
         duration_limit = 300.0 if test_mode else None  # 5 minutes for test mode
         
+        # Decode straight into memory when the extracted audio file is not wanted
+        stream_pcm = (
+            self.adapter is not None
+            and self.adapter.supports_pcm_input
+            and not config_manager.get_value("audio.keep_extracted", True)
+        )
+        
         if self.converter.is_audio_file(file_path):
-            if test_mode:
+            if test_mode and stream_pcm:
+                logger.info(f"Decoding test version (5 min) of audio file: {file_path}")
+                self.status_updated.emit("Preparing test audio (5 minutes)...")
+                
+                def progress_callback(progress: float):
+                    self.progress_updated.emit(progress * 0.3, f"Preparing test audio... {int(progress * 100)}%")
+                
+                return self.converter.decode_to_pcm(
+                    file_path,
+                    progress_callback=progress_callback,
+                    duration_limit=duration_limit
+                )
+            elif test_mode:
                 # For audio files in test mode, we need to create a trimmed version
                 logger.info(f"Creating test version (5 min) of audio file: {file_path}")
                 self.status_updated.emit("Preparing test audio (5 minutes)...")
@@ -218,6 +282,13 @@ class Controller(QObject):
             def progress_callback(progress: float):
                 self.progress_updated.emit(progress * 0.3, f"Converting... {int(progress * 100)}%")
             
+            if stream_pcm:
+                return self.converter.decode_to_pcm(
+                    file_path,
+                    progress_callback=progress_callback,
+                    duration_limit=duration_limit
+                )
+            
             audio_path = self.converter.convert_video_to_audio(
                 file_path,
                 progress_callback=progress_callback,
@@ -227,28 +298,24 @@ class Controller(QObject):
         
         raise TranscriptionError(f"Unsupported file format: {file_path.suffix}")
     
-    def _start_transcription(self, audio_path: Path, lyrics_mode: bool = False) -> None:
+    def _start_transcription(self, audio_path: Union[Path, PcmAudio], lyrics_mode: bool = False) -> None:
         """Start transcription of audio file."""
         logger.info(f"Starting transcription: {audio_path} (lyrics_mode={lyrics_mode})")
         self.transcription_service.transcribe_file(
             self.adapter,
             audio_path,
             language=self.current_language,
-            word_timestamps=lyrics_mode
+            word_timestamps=lyrics_mode,
+            beam_size=self.beam_size
         )
     
     @Slot(object)
     def _on_transcription_completed(self, result: TranscriptionResult) -> None:
         """Handle transcription completion."""
-        logger.info(f"Transcription completed: {len(result.text)} characters")
+        logger.info(f"Transcription completed: {result.text_length} characters")
         
-        if self._lyrics_mode:
-            output_format = "lyrics"
-        else:
-            output_format = config_manager.get_value("output.format", "txt")
-        save_location = config_manager.get_value("output.save_location", "same_as_input")
-        
-        output_path = self._save_transcription(result, output_format, save_location)
+        output_format = "lyrics" if self._lyrics_mode else self._output_format
+        output_path = self._save_transcription(result, output_format, self._save_location)
         
         self.transcription_completed.emit(result.text, output_path)
         self.status_updated.emit("Done")
@@ -277,38 +344,47 @@ class Controller(QObject):
             else:
                 output_path = base_path / f"transcription.{format}"
         
+        output_path.write_text(self._render_transcription(result, format), encoding="utf-8")
+        
+        logger.info(f"Transcription saved to: {output_path}")
+        return output_path
+    
+    def _render_transcription(self, result: TranscriptionResult, format: str) -> str:
+        """Render a result in the given output format, memoized per result."""
+        if self._rendered_result is not result:
+            self._rendered_result = result
+            self._rendered_cache = {}
+        key = (format, self._include_timestamps)
+        cached = self._rendered_cache.get(key)
+        if cached is not None:
+            return cached
+        
         if format == "txt":
-            # Check if timestamps should be included
-            include_timestamps = config_manager.get_value("output.include_timestamps", True)
-            if include_timestamps:
-                formatted_text = self._format_text_with_timestamps(result)
+            if self._include_timestamps:
+                rendered = self._format_text_with_timestamps(result)
             else:
-                formatted_text = result.text
-            output_path.write_text(formatted_text, encoding="utf-8")
+                rendered = result.text
         elif format == "lyrics":
-            formatted_text = self._format_lyrics(result)
-            output_path.write_text(formatted_text, encoding="utf-8")
+            rendered = self._format_lyrics(result)
         elif format == "srt":
-            output_path.write_text(self._text_to_srt(result.text), encoding="utf-8")
+            rendered = self._text_to_srt(result.text)
         elif format == "vtt":
-            output_path.write_text(self._text_to_vtt(result.text), encoding="utf-8")
+            rendered = self._text_to_vtt(result.text)
         else:
-            output_path.write_text(result.text, encoding="utf-8")
+            rendered = result.text
         
-        logger.info(f"Transcription saved to: {output_path}")
-        return output_path
+        self._rendered_cache[key] = rendered
+        return rendered
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds as timestamp string (e.g., 00:00, 00:35, 01:23)."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
         return f"{minutes:02d}:{secs:02d}"
     
     def _format_timestamp_lyrics(self, seconds: float) -> str:
         """Format seconds as lyrics timestamp (e.g., 0:04.400, 1:00.400)."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        minutes, rem = divmod(int(seconds * 1000), 60_000)
+        secs, millis = divmod(rem, 1000)
         return f"{minutes}:{secs:02d}.{millis:03d}"
     
     def _format_lyrics(self, result: TranscriptionResult) -> str:
@@ -316,25 +392,21 @@ class Controller(QObject):
         if not result.segments:
             return ""
         
+        fmt = self._format_timestamp_lyrics
         lines = []
+        append = lines.append
         for segment in result.segments:
+            seg_start = segment.get("start", 0.0)
+            seg_end = segment.get("end", 0.0)
             words = segment.get("words")
             if words:
                 for word in words:
-                    start = word.get("start", segment.get("start", 0.0))
-                    end = word.get("end", segment.get("end", 0.0))
-                    text = word.get("word", "").strip()
-                    start_str = self._format_timestamp_lyrics(start)
-                    end_str = self._format_timestamp_lyrics(end)
-                    lines.append(f"{start_str}={end_str}={text}")
+                    start = word.get("start", seg_start)
+                    end = word.get("end", seg_end)
+                    append(f"{fmt(start)}={fmt(end)}={word.get('word', '').strip()}")
             else:
                 # Fallback: use segment-level timing
-                start = segment.get("start", 0.0)
-                end = segment.get("end", 0.0)
-                text = segment.get("text", "").strip()
-                start_str = self._format_timestamp_lyrics(start)
-                end_str = self._format_timestamp_lyrics(end)
-                lines.append(f"{start_str}={end_str}={text}")
+                append(f"{fmt(seg_start)}={fmt(seg_end)}={segment.get('text', '').strip()}")
         
         return "\n".join(lines)
     
@@ -344,9 +416,9 @@ class Controller(QObject):
             # Fallback to plain text if no segments available
             return result.text
         
+        fmt = self._format_timestamp
         lines = []
         last_text = None
-        last_timestamp = None
         
         for segment in result.segments:
             start_time = segment.get("start", 0.0)
@@ -363,30 +435,26 @@ class Controller(QObject):
             if len(text) < 3:
                 continue
             
-            timestamp = self._format_timestamp(start_time)
-            lines.append(f"{timestamp} {text}")
+            lines.append(f"{fmt(start_time)} {text}")
             last_text = text
-            last_timestamp = timestamp
         
         return "\n".join(lines)
     
     def _text_to_srt(self, text: str) -> str:
         """Convert plain text to SRT format (simplified)."""
-        lines = text.strip().split("\n")
-        srt = []
-        for i, line in enumerate(lines, 1):
-            if line.strip():
-                srt.append(f"{i}\n00:00:00,000 --> 00:00:00,000\n{line}\n")
-        return "\n".join(srt)
+        lines = (line for line in text.strip().split("\n") if line.strip())
+        return "\n".join(
+            f"{i}\n00:00:00,000 --> 00:00:00,000\n{line}\n"
+            for i, line in enumerate(lines, 1)
+        )
     
     def _text_to_vtt(self, text: str) -> str:
         """Convert plain text to VTT format (simplified)."""
-        lines = text.strip().split("\n")
-        vtt = ["WEBVTT", ""]
-        for line in lines:
-            if line.strip():
-                vtt.append(f"00:00:00.000 --> 00:00:00.000\n{line}\n")
-        return "\n".join(vtt)
+        cues = (
+            f"00:00:00.000 --> 00:00:00.000\n{line}\n"
+            for line in text.strip().split("\n") if line.strip()
+        )
+        return "\n".join(chain(("WEBVTT", ""), cues))
     
     @Slot(str)
     def _on_transcription_error(self, error: str) -> None:
@@ -411,6 +479,12 @@ class Controller(QObject):
         config_manager.set_value("languages.input", language or "auto")
         logger.info(f"Language set to: {self.current_language or 'auto-detect'}")
     
+    def set_beam_size(self, beam_size: int) -> None:
+        """Set decoder beam width (1 = greedy/fast, 5 = best quality)."""
+        self.beam_size = beam_size
+        config_manager.set_value("transcription.beam_size", beam_size)
+        logger.info(f"Beam size set to: {beam_size}")
+    
     def cancel(self) -> None:
         """Cancel current operation."""
         self.transcription_service.cancel()
@@ -5,12 +5,18 @@ when using GPU. No admin rights required.
 """
 from __future__ import annotations
 
+import functools
 import importlib.util
 import os
-import platform
 import subprocess
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Deque, List, Optional, Tuple
+
+from core._platform import IS_WINDOWS, PROJECT_ROOT, get_venv_python
 
 CUDA_PACKAGES = ["nvidia-cublas-cu12", "nvidia-cudnn-cu12"]
 
@@ -19,35 +25,64 @@ _NVIDIA_PKG_MODULES = ["nvidia.cublas", "nvidia.cudnn"]
 _WIN_LIB_SUBDIR = "bin"
 _UNIX_LIB_SUBDIR = "lib"
 
+# Inherited variables that would make pip's interpreter scan extra site paths
+_PIP_STRIPPED_ENV = ("PYTHONPATH", "PYTHONHOME")
+
+# Seconds before a pip run is killed, and pip output lines kept for error messages
+_PIP_TIMEOUT = 900
+_PIP_ERROR_TAIL_LINES = 20
+
 
-def get_nvidia_cuda_lib_paths() -> List[Path]:
+def _find_nvidia_lib_dir(mod_name: str, lib_subdir: str) -> Optional[Path]:
+    """Return the lib/bin directory of an installed nvidia pip package, or None."""
+    try:
+        spec = importlib.util.find_spec(mod_name)
+        if spec is None:
+            return None
+        # Namespace packages have submodule_search_locations, regular packages have origin
+        if spec.origin:
+            pkg_dir = Path(spec.origin).resolve().parent
+        elif spec.submodule_search_locations:
+            pkg_dir = Path(spec.submodule_search_locations[0]).resolve()
+        else:
+            return None
+    except (ImportError, ValueError, AttributeError, IndexError):
+        return None
+    lib_path = pkg_dir / lib_subdir
+    return lib_path if lib_path.is_dir() else None
+
+
+@functools.lru_cache(maxsize=1)
+def get_nvidia_cuda_lib_paths() -> Tuple[Path, ...]:
     """Discover nvidia pip package lib/bin directories for CUDA runtime DLLs.
 
     Returns paths that contain cublas64_12.dll and cuDNN libraries needed by
     CTranslate2. Call prepend_nvidia_cuda_paths() to add these to the process.
+    The result is cached; install_cuda_redist() clears it after installing.
     """
     paths: List[Path] = []
-    lib_subdir = _WIN_LIB_SUBDIR if platform.system() == "Windows" else _UNIX_LIB_SUBDIR
+    lib_subdir = _WIN_LIB_SUBDIR if IS_WINDOWS else _UNIX_LIB_SUBDIR
 
     for mod_name in _NVIDIA_PKG_MODULES:
-        try:
-            spec = importlib.util.find_spec(mod_name)
-            if spec is None:
-                continue
-            # Namespace packages have submodule_search_locations, regular packages have origin
-            if spec.origin:
-                pkg_dir = Path(spec.origin).resolve().parent
-            elif spec.submodule_search_locations:
-                pkg_dir = Path(spec.submodule_search_locations[0]).resolve()
-            else:
-                continue
-            lib_path = pkg_dir / lib_subdir
-            if lib_path.is_dir() and lib_path not in paths:
-                paths.append(lib_path)
-        except (ImportError, ValueError, AttributeError, IndexError):
-            pass
+        lib_path = _find_nvidia_lib_dir(mod_name, lib_subdir)
+        if lib_path is not None and lib_path not in paths:
+            paths.append(lib_path)
+
+    return tuple(paths)
 
-    return paths
+
+def _missing_cuda_packages() -> List[str]:
+    """Return the CUDA_PACKAGES whose module or DLLs are not present yet.
+
+    Checked in-process with importlib so an already complete install skips pip
+    (and its resolver startup) entirely.
+    """
+    missing: List[str] = []
+    for mod_name, pkg in zip(_NVIDIA_PKG_MODULES, CUDA_PACKAGES):
+        lib_path = _find_nvidia_lib_dir(mod_name, _WIN_LIB_SUBDIR)
+        if lib_path is None or not any(lib_path.glob("*.dll")):
+            missing.append(pkg)
+    return missing
 
 
 def prepend_nvidia_cuda_paths() -> None:
@@ -65,7 +100,7 @@ def prepend_nvidia_cuda_paths() -> None:
     existing = os.environ.get("PATH", "")
     os.environ["PATH"] = sep.join(path_strs) + sep + existing
 
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         for p in paths:
             try:
                 os.add_dll_directory(str(p))
@@ -73,48 +108,133 @@ def prepend_nvidia_cuda_paths() -> None:
                 pass
 
 
-def _get_venv_python() -> Path | None:
-    """Get path to venv Python executable (relative to project root)."""
-    project_root = Path(__file__).resolve().parent.parent
-    if platform.system() == "Windows":
-        venv_python = project_root / "venv" / "Scripts" / "python.exe"
-    else:
-        venv_python = project_root / "venv" / "bin" / "python"
-    return venv_python if venv_python.exists() else None
-
+def _run_pip(
+    venv_python: Path,
+    args: List[str],
+    progress_callback: Optional[Callable[[str], None]] = None,
+    timeout: float = _PIP_TIMEOUT,
+) -> None:
+    """Run pip, forwarding each output line to progress_callback as it arrives.
 
-def install_cuda_redist() -> Tuple[bool, str]:
+    Only the last few lines are kept for error reporting instead of buffering the
+    whole log. Raises subprocess.CalledProcessError or subprocess.TimeoutExpired;
+    an exception from progress_callback propagates as-is after pip has been killed.
+    """
+    cmd = [str(venv_python), "-m", "pip", *args]
+    env = {k: v for k, v in os.environ.items() if k not in _PIP_STRIPPED_ENV}
+    process = subprocess.Popen(
+        cmd,
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        # pip output can contain bytes the locale codec rejects; never fail on them
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    )
+    timer = threading.Timer(timeout, process.kill)
+    timer.start()
+    tail: Deque[str] = deque(maxlen=_PIP_ERROR_TAIL_LINES)
+    try:
+        for line in process.stdout:
+            line = line.rstrip()
+            if not line:
+                continue
+            tail.append(line)
+            if progress_callback:
+                progress_callback(line)
+        process.wait()
+    finally:
+        timed_out = not timer.is_alive() and process.returncode != 0
+        timer.cancel()
+        # Reached early only if reading or the callback raised: don't orphan pip
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout, output="\n".join(tail))
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, output="\n".join(tail))
+
+
+def _download_wheels(
+    venv_python: Path,
+    packages: List[str],
+    wheel_dir: str,
+    progress_callback: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Download wheels for packages concurrently into wheel_dir.
+
+    Only the downloads run in parallel; pip installs into one environment must not
+    overlap (nvidia-cudnn-cu12 depends on nvidia-cublas-cu12). --no-deps keeps the
+    downloads disjoint; the install step resolves dependencies afterwards.
+    Raises subprocess.CalledProcessError / TimeoutExpired on the first failure.
+    """
+    def _download(pkg: str) -> None:
+        _run_pip(
+            venv_python,
+            [
+                "download",
+                "--no-input", "--disable-pip-version-check",
+                "--no-deps", "-d", wheel_dir, pkg,
+            ],
+            progress_callback,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        futures = [executor.submit(_download, pkg) for pkg in packages]
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                for other in futures:
+                    other.cancel()
+                raise future.exception()
+
+
+def install_cuda_redist(
+    progress_callback: Optional[Callable[[str], None]] = None,
+) -> Tuple[bool, str]:
     """Install CUDA runtime libraries via pip (nvidia-cublas-cu12, nvidia-cudnn-cu12).
 
     Required for faster-whisper GPU when cublas64_12.dll is missing.
     No admin rights needed. Downloads ~400-600MB.
 
+    Args:
+        progress_callback: Optional callback receiving pip output lines as they arrive.
+
     Returns:
         Tuple of (success, message).
     """
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         return False, "CUDA auto-install is only supported on Windows."
 
-    venv_python = _get_venv_python()
+    venv_python = get_venv_python()
     if not venv_python:
         return False, "Virtual environment not found. Run setup.bat first."
 
-    project_root = Path(__file__).resolve().parent.parent
+    packages = _missing_cuda_packages()
+    if not packages:
+        return True, "CUDA runtime libraries are already installed."
+
     try:
-        orig_cwd = os.getcwd()
-        os.chdir(project_root)
-        try:
-            for pkg in CUDA_PACKAGES:
-                subprocess.run(
-                    [str(venv_python), "-m", "pip", "install", pkg],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=900,
-                )
-            return True, "CUDA runtime libraries installed. Restart the application and try GPU again."
-        finally:
-            os.chdir(orig_cwd)
+        with tempfile.TemporaryDirectory() as wheel_dir:
+            _download_wheels(venv_python, packages, wheel_dir, progress_callback)
+            # One pip run resolves and installs all packages together
+            _run_pip(
+                venv_python,
+                [
+                    "install",
+                    "--no-input", "--disable-pip-version-check",
+                    "--find-links", wheel_dir,
+                    *packages,
+                ],
+                progress_callback,
+            )
+        get_nvidia_cuda_lib_paths.cache_clear()
+        return True, "CUDA runtime libraries installed. Restart the application and try GPU again."
     except subprocess.TimeoutExpired:
         return False, "Installation timed out. Try running: pip install nvidia-cublas-cu12 nvidia-cudnn-cu12"
     except subprocess.CalledProcessError as e:
@@ -1,21 +1,208 @@
 """FFmpeg download/install for Windows (used by install.py and GUI)."""
 from __future__ import annotations
 
-import platform
+import hashlib
+import http.client
 import shutil
+import threading
 import urllib.error
 import tempfile
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from core._platform import IS_WINDOWS
 
 FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
 
+# Archive is held in memory up to this size before spilling to a temp file
+_SPOOL_MAX_BYTES = 128 * 1024 * 1024
+_DOWNLOAD_CHUNK = 1024 * 1024
+
+# Archive members to extract; everything else (docs, presets, ffplay) is skipped
+_EXTRACT_SUFFIXES = ("/bin/ffmpeg.exe", "/bin/ffprobe.exe", "/LICENSE")
+
+# Parallel HTTP range download settings
+_DOWNLOAD_WORKERS = 8
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# Times a dropped download is resumed (HTTP Range from the last byte) before giving up
+_RESUME_ATTEMPTS = 3
+
+
+# progress_callback(bytes_downloaded, total_bytes); total is 0 when unknown
+ProgressCallback = Callable[[int, int], None]
+
+
+class _RangeNotSupported(Exception):
+    """Server ignored a Range request (answered 200 instead of 206)."""
+
+
+class _ByteProgress:
+    """Thread-safe download byte counter reporting at most once per _DOWNLOAD_CHUNK."""
+
+    def __init__(self, callback: Optional[ProgressCallback], total: int = 0):
+        self._callback = callback
+        self._lock = threading.Lock()
+        self.total = total
+        self._done = 0
+        self._reported = 0
+
+    def add(self, count: int) -> None:
+        if self._callback is None:
+            return
+        with self._lock:
+            self._done += count
+            if self._done - self._reported >= _DOWNLOAD_CHUNK or self._done == self.total:
+                self._reported = self._done
+                self._callback(self._done, self.total)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._done = self._reported = 0
+
+
+def _probe_content_length(url: str) -> Optional[int]:
+    """Return Content-Length if the server advertises byte-range support."""
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request, timeout=30) as response:
+            if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return None
+            length = response.headers.get("Content-Length")
+            return int(length) if length else None
+    except (urllib.error.URLError, ValueError, OSError):
+        return None
+
+
+def _download_ranges(url: str, length: int, archive: BinaryIO, progress: _ByteProgress) -> None:
+    """Download url in parallel byte ranges, writing each part at its offset in archive.
+
+    A part whose connection drops is resumed from the last byte received. Only one
+    chunk per worker is held in memory; archive itself is the only full copy.
+    """
+    part_size = -(-length // _DOWNLOAD_WORKERS)
+    # Serializes seek+write pairs on the shared file object
+    write_lock = threading.Lock()
+
+    def _fetch(start: int) -> None:
+        end = min(start + part_size, length) - 1
+        offset = start
+        for attempt in range(_RESUME_ATTEMPTS + 1):
+            try:
+                request = urllib.request.Request(url, headers={"Range": f"bytes={offset}-{end}"})
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    if response.status != 206:
+                        raise _RangeNotSupported()
+                    while offset <= end:
+                        chunk = response.read(min(_DOWNLOAD_CHUNK, end + 1 - offset))
+                        if not chunk:
+                            raise urllib.error.URLError(f"Connection closed at byte {offset} of {length}")
+                        with write_lock:
+                            archive.seek(offset)
+                            archive.write(chunk)
+                        offset += len(chunk)
+                        progress.add(len(chunk))
+                return
+            except (urllib.error.URLError, http.client.HTTPException, OSError):
+                if attempt == _RESUME_ATTEMPTS:
+                    raise
+
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+        for future in [executor.submit(_fetch, start) for start in range(0, length, part_size)]:
+            future.result()
 
-def download_ffmpeg() -> Tuple[bool, str]:
+
+def _sha256_of(archive: BinaryIO) -> str:
+    """Hash archive from the start in _DOWNLOAD_CHUNK reads."""
+    digest = hashlib.sha256()
+    archive.seek(0)
+    while chunk := archive.read(_DOWNLOAD_CHUNK):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stream_download(url: str, archive: BinaryIO, progress: _ByteProgress) -> str:
+    """Download url sequentially into archive, resuming with Range after a dropped connection.
+
+    Returns:
+        Hex SHA-256 of the downloaded bytes, hashed as they stream in.
+    """
+    digest = hashlib.sha256()
+    written = 0
+    for attempt in range(_RESUME_ATTEMPTS + 1):
+        headers = {"Range": f"bytes={written}-"} if written else {}
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=60) as response:
+                if written and response.status != 206:
+                    # Server cannot resume: start over
+                    archive.seek(0)
+                    archive.truncate()
+                    digest = hashlib.sha256()
+                    written = 0
+                    progress.reset()
+                remaining = response.headers.get("Content-Length")
+                expected = written + int(remaining) if remaining else None
+                progress.total = expected or 0
+                while chunk := response.read(_DOWNLOAD_CHUNK):
+                    archive.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+                    progress.add(len(chunk))
+                # http.client reports a truncated body as a normal EOF
+                if expected is not None and written < expected:
+                    raise urllib.error.URLError(f"Connection closed at byte {written} of {expected}")
+            return digest.hexdigest()
+        except (urllib.error.URLError, http.client.HTTPException, OSError):
+            if attempt == _RESUME_ATTEMPTS:
+                raise
+
+
+def _expected_sha256(url: str) -> Optional[str]:
+    """Fetch the published SHA-256 for url (url + ".sha256"), or None if unavailable."""
+    try:
+        with urllib.request.urlopen(url + ".sha256", timeout=30) as response:
+            token = response.read(256).decode("ascii", "replace").split()[0].lower()
+    except (urllib.error.URLError, OSError, IndexError):
+        return None
+    if len(token) == 64 and all(c in "0123456789abcdef" for c in token):
+        return token
+    return None
+
+
+def _fetch_archive(url: str, archive: BinaryIO, progress_callback: Optional[ProgressCallback] = None) -> str:
+    """Download url into archive, using parallel range requests when possible.
+
+    Args:
+        url: Archive URL
+        archive: Writable binary file receiving the bytes
+        progress_callback: Optional byte progress callback (may be called from worker threads)
+
+    Returns:
+        Hex SHA-256 of the downloaded bytes.
+    """
+    length = _probe_content_length(url)
+    if length and length >= _PARALLEL_MIN_BYTES:
+        try:
+            _download_ranges(url, length, archive, _ByteProgress(progress_callback, length))
+            return _sha256_of(archive)
+        except _RangeNotSupported:
+            archive.seek(0)
+            archive.truncate()
+
+    return _stream_download(url, archive, _ByteProgress(progress_callback))
+
+
+def download_ffmpeg(progress_callback: Optional[ProgressCallback] = None) -> Tuple[bool, str]:
     """Download and extract FFmpeg for Windows.
 
+    Args:
+        progress_callback: Optional callback(bytes_downloaded, total_bytes) for the
+            archive download; total is 0 when the server sends no length. It may be
+            called from worker threads.
+
     Returns:
         Tuple of (success, message).
     """
@@ -25,31 +212,35 @@ def download_ffmpeg() -> Tuple[bool, str]:
     if ffmpeg_exe.exists():
         return True, str(ffmpeg_exe.absolute())
 
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         return False, "FFmpeg auto-download is only supported on Windows. Please install FFmpeg via your package manager."
 
-    try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            zip_path = Path(temp_dir) / "ffmpeg.zip"
+    if ffmpeg_dir.exists():
+        return False, f"{ffmpeg_dir.absolute()} exists but has no bin/ffmpeg.exe; remove it and retry"
 
-            urllib.request.urlretrieve(FFMPEG_URL, zip_path)
-
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                extract_temp = Path(temp_dir) / "extract"
-                zip_ref.extractall(extract_temp)
+    # Extracted next to the final folder so the finishing rename never copies
+    staging_dir = ffmpeg_dir.with_name(ffmpeg_dir.name + ".partial")
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as archive:
+            expected = _expected_sha256(FFMPEG_URL)
+            actual = _fetch_archive(FFMPEG_URL, archive, progress_callback)
+            if expected and actual != expected:
+                return False, f"FFmpeg download is corrupted (SHA-256 {actual}, expected {expected}); please retry"
+            archive.seek(0)
 
-                extracted_dirs = list(extract_temp.iterdir())
-                if not extracted_dirs:
-                    return False, "FFmpeg archive structure unexpected"
+            with zipfile.ZipFile(archive, "r") as zip_ref:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                for info in zip_ref.infolist():
+                    # Only decompress the executables the app uses (plus the license)
+                    if not info.filename.endswith(_EXTRACT_SUFFIXES):
+                        continue
+                    # Drop the versioned top-level folder (ffmpeg-X.Y-essentials_build/)
+                    info.filename = info.filename.split("/", 1)[1]
+                    zip_ref.extract(info, staging_dir)
 
-                source_dir = extracted_dirs[0]
-                for item in source_dir.rglob("ffmpeg.exe"):
-                    bin_dir = item.parent
-                    ffmpeg_root = bin_dir.parent
-                    shutil.copytree(ffmpeg_root, ffmpeg_dir)
-                    break
-                else:
-                    return False, "Could not find ffmpeg.exe in archive"
+        if not (staging_dir / "bin" / "ffmpeg.exe").exists():
+            return False, "Could not find ffmpeg.exe in archive"
+        staging_dir.rename(ffmpeg_dir)
 
         if ffmpeg_exe.exists():
             return True, str(ffmpeg_exe.absolute())
@@ -61,3 +252,6 @@ def download_ffmpeg() -> Tuple[bool, str]:
         return False, "Downloaded file is not a valid ZIP archive"
     except Exception as e:
         return False, str(e)
+    finally:
+        # Leftover after any failure; already renamed away on success
+        shutil.rmtree(staging_dir, ignore_errors=True)
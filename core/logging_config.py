@@ -1,15 +1,29 @@
 """Logging configuration for Open Video Transcribe."""
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
 
 _LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 _DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Background thread that writes queued records to the file and console handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush pending records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def get_log_directory() -> Path:
     """Get the log directory path."""
@@ -23,7 +37,12 @@ def get_log_directory() -> Path:
 
 
 def setup_logging(level: int = logging.INFO) -> Path:
-    """Setup logging with file and console handlers."""
+    """Setup logging with file and console handlers.
+
+    Loggers only enqueue records; a QueueListener thread does the file and
+    console I/O so callers never block on disk writes.
+    """
+    global _queue_listener
     log_dir = get_log_directory()
     log_file = log_dir / f"transcriber_{datetime.now().strftime('%Y%m%d')}.log"
     
@@ -32,6 +51,7 @@ def setup_logging(level: int = logging.INFO) -> Path:
     
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
     
     file_handler = RotatingFileHandler(
         log_file,
@@ -41,16 +61,24 @@ def setup_logging(level: int = logging.INFO) -> Path:
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(logging.Formatter(_LOG_FORMAT, _DATE_FORMAT))
-    root_logger.addHandler(file_handler)
     
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if level == logging.DEBUG else logging.INFO)
     console_handler.setFormatter(logging.Formatter(_LOG_FORMAT, _DATE_FORMAT))
-    root_logger.addHandler(console_handler)
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
     
     return log_file
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
     return logging.getLogger(name)
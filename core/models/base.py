@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Sequence, Union
+from dataclasses import dataclass, field
+
+# Sample rate of in-memory PCM audio handed to adapters (what Whisper expects)
+PCM_SAMPLE_RATE = 16000
 
 
 @dataclass
@@ -13,11 +17,32 @@ class TranscriptionResult:
     segments: List[Dict[str, Any]]
     language: Optional[str] = None
     language_probability: Optional[float] = None
+    # len(text), computed once so logging and the GUI don't rescan large transcripts
+    text_length: int = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self.text_length = len(self.text)
+
+
+@dataclass
+class PcmAudio:
+    """Decoded 16 kHz mono audio held in memory instead of on disk."""
+    samples: Any
+    source: Path
+    
+    def __str__(self) -> str:
+        return f"{self.source} (in-memory PCM)"
+
+
+AudioInput = Union[str, PcmAudio]
 
 
 class TranscriptionAdapter(ABC):
     """Abstract base class for transcription model adapters."""
     
+    # Adapters that accept PcmAudio in transcribe() set this to True
+    supports_pcm_input: bool = False
+    
     @abstractmethod
     def load_model(self, model_name: str, device: str, **kwargs) -> Any:
         """Load the transcription model.
@@ -35,23 +60,35 @@ class TranscriptionAdapter(ABC):
     @abstractmethod
     def transcribe(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         language: Optional[str] = None,
         progress_callback: Optional[callable] = None,
-        word_timestamps: bool = False
+        word_timestamps: bool = False,
+        beam_size: int = 5
     ) -> TranscriptionResult:
         """Transcribe audio file.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or PcmAudio if supports_pcm_input
             language: Language code (None for auto-detect)
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates; it may raise
+                InterruptedError to abort, which adapters must let propagate
+            word_timestamps: If True, include word-level timestamps
+            beam_size: Decoder beam width (1 = greedy); adapters may ignore it
             
         Returns:
             TranscriptionResult object
         """
         pass
     
+    def warm_up(self) -> None:
+        """Optionally prime the loaded model (e.g. GPU kernels) before real work.
+        
+        Called by the controller on the loading thread right after load_model
+        succeeds. The default implementation does nothing.
+        """
+        pass
+    
     @abstractmethod
     def supports_language(self, language_code: str) -> bool:
         """Check if the model supports a specific language.
@@ -65,11 +102,11 @@ class TranscriptionAdapter(ABC):
         pass
     
     @abstractmethod
-    def get_supported_languages(self) -> List[str]:
-        """Get list of supported language codes.
+    def get_supported_languages(self) -> Sequence[str]:
+        """Get supported language codes.
         
         Returns:
-            List of ISO 639-1 language codes
+            Immutable sequence of ISO 639-1 language codes
         """
         pass
     
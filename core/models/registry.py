@@ -1,35 +1,54 @@
 """Model registry for discovering and managing transcription models."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+from typing import Callable, Dict, List, Optional, Type, Union
 from core.models.base import TranscriptionAdapter
-from core.models.whisper_adapter import WhisperAdapter
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Zero-arg callable returning an adapter class; lets adapters be imported on first use
+AdapterLoader = Callable[[], Type[TranscriptionAdapter]]
+
+
+def _load_whisper_adapter() -> Type[TranscriptionAdapter]:
+    """Import WhisperAdapter only when a whisper adapter is first requested."""
+    from core.models.whisper_adapter import WhisperAdapter
+    return WhisperAdapter
+
+
+# Built-in adapters, resolved lazily so importing the registry stays cheap
+_DEFAULT_ADAPTERS: Dict[str, AdapterLoader] = {
+    "whisper": _load_whisper_adapter,
+}
+
 
 class ModelRegistry:
     """Registry for transcription model adapters."""
     
     def __init__(self):
         self._adapters: Dict[str, Type[TranscriptionAdapter]] = {}
-        self._register_default_adapters()
-    
-    def _register_default_adapters(self) -> None:
-        """Register default model adapters."""
-        self.register_adapter("whisper", WhisperAdapter)
-        logger.info("Registered default adapters")
+        self._loaders: Dict[str, AdapterLoader] = dict(_DEFAULT_ADAPTERS)
     
-    def register_adapter(self, model_type: str, adapter_class: Type[TranscriptionAdapter]) -> None:
+    def register_adapter(
+        self,
+        model_type: str,
+        adapter: Union[Type[TranscriptionAdapter], AdapterLoader],
+    ) -> None:
         """Register a model adapter.
         
         Args:
             model_type: Type identifier (e.g., 'whisper', 'huggingface')
-            adapter_class: Adapter class to register
+            adapter: Adapter class, or a zero-arg loader returning the class
+                (imported on first get_adapter/create_adapter call)
         """
-        self._adapters[model_type] = adapter_class
-        logger.info(f"Registered adapter: {model_type}")
+        if isinstance(adapter, type):
+            self._adapters[model_type] = adapter
+            self._loaders.pop(model_type, None)
+        else:
+            self._loaders[model_type] = adapter
+            self._adapters.pop(model_type, None)
+        logger.info("Registered adapter: %s", model_type)
     
     def get_adapter(self, model_type: str) -> Optional[Type[TranscriptionAdapter]]:
         """Get an adapter class by type.
@@ -40,7 +59,14 @@ class ModelRegistry:
         Returns:
             Adapter class or None if not found
         """
-        return self._adapters.get(model_type)
+        adapter_class = self._adapters.get(model_type)
+        if adapter_class is None:
+            loader = self._loaders.get(model_type)
+            if loader is None:
+                return None
+            adapter_class = self._adapters[model_type] = loader()
+            del self._loaders[model_type]
+        return adapter_class
     
     def create_adapter(self, model_type: str) -> Optional[TranscriptionAdapter]:
         """Create an adapter instance.
@@ -62,7 +88,7 @@ class ModelRegistry:
         Returns:
             List of model type identifiers
         """
-        return list(self._adapters.keys())
+        return [*self._adapters, *self._loaders]
     
     def is_registered(self, model_type: str) -> bool:
         """Check if a model type is registered.
@@ -73,7 +99,7 @@ class ModelRegistry:
         Returns:
             True if registered
         """
-        return model_type in self._adapters
+        return model_type in self._adapters or model_type in self._loaders
 
 
 model_registry = ModelRegistry()
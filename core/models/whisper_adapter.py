@@ -1,12 +1,23 @@
 """Whisper model adapter using faster-whisper."""
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
-import psutil
+import functools
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
-from faster_whisper import WhisperModel
-
-from core.models.base import TranscriptionAdapter, TranscriptionResult
+from core.models.base import (
+    TranscriptionAdapter,
+    TranscriptionResult,
+    AudioInput,
+    PcmAudio,
+    PCM_SAMPLE_RATE,
+)
 from core.models.model_info import (
     resolve_repo,
     get_systran_fallback,
@@ -15,13 +26,108 @@ from core.logging_config import get_logger
 from core.exceptions import ModelLoadError
 from config.manager import config_manager
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
 logger = get_logger(__name__)
 
+# Minimum wall-clock seconds between transcription progress callbacks
+_PROGRESS_INTERVAL = 0.1
+
+# CTranslate2 decoding gains little beyond this many CPU threads
+_MAX_CPU_THREADS = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _default_cpu_threads() -> int:
+    """Physical cores this process may actually run on, capped at _MAX_CPU_THREADS.
+    
+    psutil reports the host's cores; the CPU affinity mask (taskset, containers)
+    can be smaller, and oversubscribing it makes decoder threads thrash.
+    """
+    import psutil
+    threads = psutil.cpu_count(logical=False) or 1
+    try:
+        threads = min(threads, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        # No sched_getaffinity on Windows/macOS
+        pass
+    return max(1, min(threads, _MAX_CPU_THREADS))
+
+
+# RuntimeError text that means the CUDA runtime (not the input) failed
+_CUDA_ERROR_RE = re.compile(r"cublas|cudnn|cuda", re.IGNORECASE)
+
+# Silence longer than this (ms) is cut by the VAD filter before decoding
+_VAD_MIN_SILENCE_MS = 500
+
+# CUDA: raw int8 runs slower than float16 on GPU; int8 weights with float16
+# activations keep the memory savings at close to float16 speed
+_CUDA_COMPUTE_TYPES = {"int8": "int8_float16"}
+
+# CPU: no float16 math; map half-precision variants to their CPU equivalents
+_CPU_COMPUTE_TYPES = {
+    "float16": "float32",
+    "bfloat16": "float32",
+    "int8_float16": "int8",
+    "int8_bfloat16": "int8",
+}
+_CPU_SUPPORTED_COMPUTE_TYPES = frozenset({"float32", "int8", "int8_float32"})
+
+# Loaded models kept across adapters, keyed by (repo, device, compute_type, cpu_threads).
+# A single entry: caching a new model releases the previous one on any device, so a
+# CPU model (GBs of float32 RAM) does not linger after switching to CUDA or back.
+_MODEL_CACHE_SIZE = 1
+_MODEL_CACHE: OrderedDict[Tuple[str, str, str, int], WhisperModel] = OrderedDict()
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_model(key: Tuple[str, str, str, int]) -> Optional[WhisperModel]:
+    """Return a cached model for key (marking it most recently used), or None."""
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            _MODEL_CACHE.move_to_end(key)
+        return model
+
+
+def _cache_model(key: Tuple[str, str, str, int], model: WhisperModel) -> None:
+    """Cache model, evicting least recently used entries beyond _MODEL_CACHE_SIZE."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE[key] = model
+        _MODEL_CACHE.move_to_end(key)
+        while len(_MODEL_CACHE) > _MODEL_CACHE_SIZE:
+            _MODEL_CACHE.popitem(last=False)
+
+
+def _drop_cached_models(device: str) -> None:
+    """Forget cached models on device (e.g. after CUDA failed at runtime)."""
+    with _MODEL_CACHE_LOCK:
+        for key in [k for k in _MODEL_CACHE if k[1] == device]:
+            del _MODEL_CACHE[key]
+
+
+def _resolve_compute_type(device: str, quantization: str) -> str:
+    """Map the user's quantization choice to a CTranslate2 compute_type for device."""
+    if device == "cpu":
+        compute_type = _CPU_COMPUTE_TYPES.get(quantization, quantization)
+        return compute_type if compute_type in _CPU_SUPPORTED_COMPUTE_TYPES else "float32"
+    compute_type = _CUDA_COMPUTE_TYPES.get(quantization, quantization)
+    if compute_type != quantization:
+        logger.warning(
+            "int8 on CUDA is slower than float16; using %s (int8 weights, float16 math)",
+            compute_type,
+        )
+    return compute_type
+
 
 class WhisperAdapter(TranscriptionAdapter):
     """Adapter for faster-whisper models."""
     
-    WHISPER_LANGUAGES = [
+    supports_pcm_input = True
+    
+    # Tuple so get_supported_languages can return it without copying
+    WHISPER_LANGUAGES: Tuple[str, ...] = (
         "af", "am", "ar", "as", "az", "ba", "be", "bg", "bn", "bo", "br", "bs", "ca", "cs",
         "cy", "da", "de", "el", "en", "es", "et", "eu", "fa", "fi", "fo", "fr", "gl", "gu",
         "ha", "haw", "he", "hi", "hr", "ht", "hu", "hy", "id", "is", "it", "ja", "jw", "ka",
@@ -29,8 +135,9 @@ class WhisperAdapter(TranscriptionAdapter):
         "mn", "mr", "ms", "mt", "my", "ne", "nl", "nn", "no", "oc", "pa", "pl", "ps", "pt",
         "ro", "ru", "sa", "sd", "si", "sk", "sl", "sn", "so", "sq", "sr", "su", "sv", "sw",
         "ta", "te", "tg", "th", "tk", "tl", "tr", "tt", "uk", "ur", "uz", "vi", "yi", "yo",
-        "zh", "yue"
-    ]
+        "zh", "yue",
+    )
+    _LANG_SET: frozenset[str] = frozenset(lang.lower() for lang in WHISPER_LANGUAGES)
     
     def __init__(self):
         self.model: Optional[WhisperModel] = None
@@ -38,6 +145,9 @@ class WhisperAdapter(TranscriptionAdapter):
         self.quantization: Optional[str] = None
         self.device: Optional[str] = None
         self.cpu_threads: Optional[int] = None
+        self._warmed_up = False
+        # Makes the warm-up check-and-run atomic so it cannot run twice
+        self._warm_up_lock = threading.Lock()
     
     def load_model(
         self,
@@ -47,28 +157,34 @@ class WhisperAdapter(TranscriptionAdapter):
         cpu_threads: Optional[int] = None
     ) -> WhisperModel:
         """Load a Whisper model."""
+        # Imported lazily: faster_whisper pulls in ctranslate2 and the CUDA libraries
+        from faster_whisper import WhisperModel
+        
         if cpu_threads is None:
-            cpu_threads = psutil.cpu_count(logical=False) or 1
+            cpu_threads = _default_cpu_threads()
         
-        # CPU does not support float16; use float32 (works with float16 model weights)
-        compute_type = quantization
-        if device == "cpu":
-            if quantization in ("float16", "bfloat16"):
-                compute_type = "float32"
-            elif quantization not in ("float32", "int8", "int8_float32"):
-                compute_type = "float32"
+        compute_type = _resolve_compute_type(device, quantization)
         
         repo_or_id, use_systran_direct = resolve_repo(model_name, quantization)
 
         def _try_load(model_arg: str) -> WhisperModel:
-            return WhisperModel(
+            key = (model_arg, device, compute_type, cpu_threads)
+            model = _get_cached_model(key)
+            if model is not None:
+                logger.info("Reusing loaded model %s (%s, %s)", model_arg, device, compute_type)
+                return model
+            model = WhisperModel(
                 model_arg,
                 device=device,
                 compute_type=compute_type,
                 cpu_threads=cpu_threads,
+                # One transcription at a time per model (the controller runs one job)
+                num_workers=1,
             )
+            _cache_model(key, model)
+            return model
 
-        logger.info(f"Loading Whisper model {repo_or_id} on {device}")
+        logger.info("Loading Whisper model %s on %s", repo_or_id, device)
 
         try:
             self.model = _try_load(repo_or_id)
@@ -76,7 +192,8 @@ class WhisperAdapter(TranscriptionAdapter):
             self.quantization = quantization
             self.device = device
             self.cpu_threads = cpu_threads
-            logger.info(f"Model {repo_or_id} loaded successfully")
+            self._warmed_up = False
+            logger.info("Model %s loaded successfully", repo_or_id)
             return self.model
         except Exception as e:
             err_str = str(e).lower()
@@ -87,7 +204,7 @@ class WhisperAdapter(TranscriptionAdapter):
             if is_http_error and not use_systran_direct:
                 fallback_id = get_systran_fallback(model_name)
                 logger.warning(
-                    f"Primary repo failed ({repo_or_id}), trying Systran fallback: {fallback_id}"
+                    "Primary repo failed (%s), trying Systran fallback: %s", repo_or_id, fallback_id
                 )
                 try:
                     self.model = _try_load(fallback_id)
@@ -95,46 +212,74 @@ class WhisperAdapter(TranscriptionAdapter):
                     self.quantization = quantization
                     self.device = device
                     self.cpu_threads = cpu_threads
-                    logger.info(f"Model loaded from Systran fallback: {fallback_id}")
+                    self._warmed_up = False
+                    logger.info("Model loaded from Systran fallback: %s", fallback_id)
                     return self.model
                 except Exception as e2:
-                    logger.exception(f"Fallback failed for {fallback_id}")
+                    logger.exception("Fallback failed for %s", fallback_id)
                     raise ModelLoadError(
                         f"Model load failed. Primary: {e}. Fallback: {e2}. "
                         "Check internet and HuggingFace access."
                     ) from e2
-            logger.exception(f"Failed to load model {repo_or_id}")
+            logger.exception("Failed to load model %s", repo_or_id)
             raise ModelLoadError(
                 f"Error loading model {repo_or_id}: {e}. "
                 "Check internet connection and HuggingFace access."
             ) from e
     
+    def warm_up(self) -> None:
+        """Run one second of silence through the model so CUDA kernels are ready."""
+        with self._warm_up_lock:
+            if not self.model or self.device != "cuda" or self._warmed_up:
+                return
+            try:
+                import numpy as np
+                
+                segments, _ = self.model.transcribe(
+                    np.zeros(PCM_SAMPLE_RATE, dtype=np.float32),
+                    language="en",
+                    beam_size=1,
+                )
+                for _ in segments:
+                    pass
+                self._warmed_up = True
+                logger.debug("Whisper model warm-up complete")
+            except Exception as e:
+                logger.debug("Whisper model warm-up skipped: %s", e)
+    
     def transcribe(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         language: Optional[str] = None,
         progress_callback: Optional[callable] = None,
-        word_timestamps: bool = False
+        word_timestamps: bool = False,
+        beam_size: int = 5
     ) -> TranscriptionResult:
         """Transcribe audio file."""
         if not self.model:
             raise ModelLoadError("No model loaded")
         
-        logger.info(f"Transcribing {audio_path} with language: {language or 'auto-detect'}, word_timestamps: {word_timestamps}")
+        logger.info(
+            "Transcribing %s with language: %s, word_timestamps: %s, beam_size: %d",
+            audio_path, language or "auto-detect", word_timestamps, beam_size,
+        )
+        
+        # Resolved once so the CPU fallback below does not decode the file again
+        audio = self._load_audio(audio_path)
         
         try:
             return self._transcribe_impl(
-                audio_path, language, progress_callback, word_timestamps
+                audio, language, progress_callback, word_timestamps, beam_size
             )
         except RuntimeError as e:
-            err_str = str(e).lower()
-            if self.device == "cuda" and ("cublas" in err_str or "cuda" in err_str or "cudnn" in err_str):
+            if self.device == "cuda" and _CUDA_ERROR_RE.search(str(e)):
                 logger.warning(
                     "CUDA failed (%s), falling back to CPU. "
                     "For GPU: Settings > Install CUDA Runtime (nvidia-cublas-cu12, nvidia-cudnn-cu12), then restart.",
                     e,
                 )
                 config_manager.set_value("model.device", "cpu")
+                _drop_cached_models("cuda")
                 cpu_quant = "float32" if self.quantization == "float16" else self.quantization
                 self.load_model(
                     self.model_name,
@@ -143,52 +288,138 @@ class WhisperAdapter(TranscriptionAdapter):
                     cpu_threads=self.cpu_threads,
                 )
                 return self._transcribe_impl(
-                    audio_path, language, progress_callback, word_timestamps
+                    audio, language, progress_callback, word_timestamps, beam_size
                 )
             raise
+        except InterruptedError:
+            # Raised by progress_callback when the caller cancels; not a failure
+            raise
         except Exception:
             logger.exception("Transcription failed")
             raise
 
+    @staticmethod
+    def _load_audio(audio_path: AudioInput) -> AudioInput:
+        """Return in-memory samples for whisper-ready WAVs, else the input unchanged.
+        
+        16 kHz mono s16le WAVs (e.g. files written by the converter) are read
+        directly, skipping faster-whisper's decode and resample pass.
+        """
+        if isinstance(audio_path, PcmAudio) or not str(audio_path).lower().endswith(".wav"):
+            return audio_path
+        from core.audio.converter import read_pcm_wav
+        pcm = read_pcm_wav(Path(audio_path))
+        if pcm is None:
+            return audio_path
+        logger.debug("Loaded %s directly as 16 kHz PCM", audio_path)
+        return pcm
+    
+    def iter_transcribe(
+        self,
+        audio_path: AudioInput,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+    ) -> Tuple[Iterator[Dict[str, Any]], Any]:
+        """Start decoding and return segment dicts lazily.
+        
+        Segments are decoded by CTranslate2 as the iterator is consumed, so callers
+        can handle each one (e.g. show partial results) while decoding continues.
+        
+        Args:
+            audio_path: Audio file path or PcmAudio
+            language: Language code (None for auto-detect)
+            word_timestamps: If True, include word-level timestamps
+            beam_size: Decoder beam width (1 = greedy)
+            
+        Returns:
+            Tuple of (iterator of segment dicts, faster-whisper TranscriptionInfo)
+        """
+        if not self.model:
+            raise ModelLoadError("No model loaded")
+        
+        audio = audio_path.samples if isinstance(audio_path, PcmAudio) else audio_path
+        decode_options: Dict[str, Any] = {
+            "beam_size": beam_size,
+            "best_of": beam_size,
+            # Prompting with the previous text grows the decoder context on long files
+            "condition_on_previous_text": config_manager.get_value(
+                "transcription.condition_on_previous_text", False
+            ),
+        }
+        if config_manager.get_value("transcription.vad_filter", True):
+            # Silent stretches never reach the decoder
+            decode_options["vad_filter"] = True
+            decode_options["vad_parameters"] = {"min_silence_duration_ms": _VAD_MIN_SILENCE_MS}
+        if beam_size == 1:
+            # Greedy mode: no temperature fallback re-decodes either
+            decode_options["temperature"] = 0.0
+        segments, info = self.model.transcribe(
+            audio,
+            language=language if language and language != "auto" else None,
+            word_timestamps=word_timestamps,
+            **decode_options,
+        )
+        return self._iter_segment_dicts(segments, word_timestamps), info
+    
+    @staticmethod
+    def _iter_segment_dicts(segments, word_timestamps: bool) -> Iterator[Dict[str, Any]]:
+        """Convert faster-whisper Segments to plain dicts; each Segment is read once."""
+        # Checked once so the per-segment debug line costs nothing when disabled
+        debug_segments = logger.isEnabledFor(logging.DEBUG)
+        for index, segment in enumerate(segments, 1):
+            start, end, seg_text = segment.start, segment.end, segment.text.strip()
+            if debug_segments:
+                logger.debug("Segment %d: %.2f-%.2f", index, start, end)
+            segment_dict = {"start": start, "end": end, "text": seg_text}
+            if word_timestamps:
+                words = segment.words
+                if words:
+                    segment_dict["words"] = [
+                        {"start": w.start, "end": w.end, "word": w.word}
+                        for w in words
+                    ]
+            yield segment_dict
+    
     def _transcribe_impl(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         language: Optional[str] = None,
         progress_callback: Optional[callable] = None,
         word_timestamps: bool = False,
+        beam_size: int = 5,
     ) -> TranscriptionResult:
         """Internal transcription implementation."""
-        segments, info = self.model.transcribe(
-            audio_path,
-            language=language if language and language != "auto" else None,
-            beam_size=5,
-            word_timestamps=word_timestamps
-        )
+        segments, info = self.iter_transcribe(audio_path, language, word_timestamps, beam_size)
         
         # Get duration from info if available
-        total_duration = None
-        if info and hasattr(info, 'duration'):
-            total_duration = info.duration
-        elif info and hasattr(info, 'language'):
-            pass
+        total_duration = getattr(info, 'duration', None) if info else None
         
-        segments_list = []
+        segment_dicts = []
+        text_parts = []
+        add_segment = segment_dicts.append
+        add_text = text_parts.append
         segment_count = 0
-        last_progress_update = 0.0
         max_seen_time = 0.0
+        last_callback = time.monotonic()
         
-        for segment in segments:
-            segments_list.append(segment)
+        for segment_dict in segments:
             segment_count += 1
+            end = segment_dict["end"]
+            add_segment(segment_dict)
+            add_text(segment_dict["text"])
             
-            if segment.end:
-                max_seen_time = max(max_seen_time, segment.end)
+            if end and end > max_seen_time:
+                max_seen_time = end
             
-            if progress_callback and (segment_count % 5 == 0 or (segment.end and segment.end - last_progress_update > 5.0)):
-                if total_duration and segment.end:
-                    progress = min(segment.end / total_duration, 0.99)
+            if not progress_callback:
+                continue
+            now = time.monotonic()
+            if now - last_callback >= _PROGRESS_INTERVAL:
+                last_callback = now
+                if total_duration and end:
+                    progress = min(end / total_duration, 0.99)
                     progress_callback(progress, f"Transcribing... {int(progress * 100)}%")
-                    last_progress_update = segment.end
                 elif max_seen_time > 0:
                     estimated_total = max_seen_time * 1.1
                     progress = min(max_seen_time / estimated_total, 0.95)
@@ -200,30 +431,13 @@ class WhisperAdapter(TranscriptionAdapter):
         if progress_callback:
             progress_callback(1.0, "Transcription complete")
         
-        logger.info(f"Transcription completed, got {len(segments_list)} segments")
-        
-        segment_dicts = []
-        text_parts = []
-        
-        for segment in segments_list:
-            segment_dict = {
-                "start": segment.start,
-                "end": segment.end,
-                "text": segment.text
-            }
-            if word_timestamps and segment.words:
-                segment_dict["words"] = [
-                    {"start": w.start, "end": w.end, "word": w.word}
-                    for w in segment.words
-                ]
-            segment_dicts.append(segment_dict)
-            text_parts.append(segment.text)
+        logger.info("Transcription completed, got %d segments", segment_count)
         
         text = "\n".join(text_parts)
         detected_lang = getattr(info, 'language', None) if info else None
         lang_prob = getattr(info, 'language_probability', None) if info else None
         if info:
-            logger.info(f"Detected language: {detected_lang}, probability: {lang_prob}")
+            logger.info("Detected language: %s, probability: %s", detected_lang, lang_prob)
         
         return TranscriptionResult(
             text=text,
@@ -234,11 +448,13 @@ class WhisperAdapter(TranscriptionAdapter):
     
     def supports_language(self, language_code: str) -> bool:
         """Check if language is supported."""
-        return language_code.lower() in [lang.lower() for lang in self.WHISPER_LANGUAGES]
+        if not language_code.islower():
+            language_code = language_code.lower()
+        return language_code in self._LANG_SET
     
-    def get_supported_languages(self) -> List[str]:
-        """Get list of supported languages."""
-        return self.WHISPER_LANGUAGES.copy()
+    def get_supported_languages(self) -> Tuple[str, ...]:
+        """Get supported languages (shared immutable tuple)."""
+        return self.WHISPER_LANGUAGES
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get model information."""
@@ -1,18 +1,23 @@
 """Progress tracking for transcription."""
 from __future__ import annotations
 
+import time
 from typing import Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 
 @dataclass
 class ProgressInfo:
-    """Progress information."""
+    """Progress information.
+    
+    start_time is a time.monotonic() reading, so ETAs are immune to wall-clock
+    adjustments and cost no datetime allocations per update.
+    """
     current: float
     total: float
     message: str
-    start_time: Optional[datetime] = None
+    start_time: Optional[float] = None
     
     @property
     def percentage(self) -> float:
@@ -24,13 +29,11 @@ class ProgressInfo:
     @property
     def estimated_time_remaining(self) -> Optional[timedelta]:
         """Estimate time remaining."""
-        if not self.start_time or self.current == 0:
+        if self.start_time is None or self.current <= 0:
             return None
         
-        elapsed = datetime.now() - self.start_time
-        if self.current > 0:
-            rate = self.current / elapsed.total_seconds()
-            remaining = (self.total - self.current) / rate
-            return timedelta(seconds=int(remaining))
-        return None
-
+        elapsed = time.monotonic() - self.start_time
+        if elapsed <= 0:
+            return None
+        remaining = (self.total - self.current) * elapsed / self.current
+        return timedelta(seconds=int(remaining))
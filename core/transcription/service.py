@@ -1,69 +1,93 @@
 """Transcription service with cancellation support."""
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from typing import List, Optional, Tuple, Union
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
 
-from core.models.base import TranscriptionAdapter, TranscriptionResult
+from core.models.base import TranscriptionAdapter, TranscriptionResult, PcmAudio
 from core.logging_config import get_logger
 from core.exceptions import TranscriptionError
 
 logger = get_logger(__name__)
 
+# Minimum milliseconds between progress signals forwarded to the GUI (~30 fps)
+_PROGRESS_COALESCE_MS = 33
 
-class _TranscriptionThread(QThread):
-    """Thread for running transcription."""
+
+class _TranscriptionSignals(QObject):
+    """Signals for _TranscriptionTask (QRunnable is not a QObject)."""
     transcription_done = Signal(object)
     error_occurred = Signal(str)
     progress_updated = Signal(float, str)
 
+
+class _TranscriptionTask(QRunnable):
+    """Transcription job run on the service's thread pool."""
+
     def __init__(
         self,
         adapter: TranscriptionAdapter,
-        audio_file: Path,
+        audio_file: Union[Path, PcmAudio],
         language: Optional[str] = None,
-        word_timestamps: bool = False
+        word_timestamps: bool = False,
+        beam_size: int = 5
     ) -> None:
         super().__init__()
+        # Owned by the service, which keeps a reference until done is set
+        self.setAutoDelete(False)
+        self.signals = _TranscriptionSignals()
+        self.cancelled = threading.Event()
+        self.done = threading.Event()
         self.adapter = adapter
-        self.audio_file = Path(audio_file)
+        self.audio_file = audio_file if isinstance(audio_file, PcmAudio) else Path(audio_file)
         self.language = language
         self.word_timestamps = word_timestamps
+        self.beam_size = beam_size
 
     def run(self) -> None:
-        """Run transcription in thread."""
+        """Run transcription on a pool thread."""
         try:
-            if self.isInterruptionRequested():
+            if self.cancelled.is_set():
                 return
             
             logger.info(f"Starting transcription: {self.audio_file} (language: {self.language or 'auto-detect'})")
             
-            # Create progress callback that emits signals
+            # Create progress callback that emits signals; repeats of the last
+            # update are dropped so no redundant queued calls reach the GUI thread
+            last_update = None
+
             def progress_callback(progress: float, message: str = ""):
-                if not self.isInterruptionRequested():
-                    self.progress_updated.emit(progress, message or f"Transcribing... {int(progress * 100)}%")
+                nonlocal last_update
+                if self.cancelled.is_set():
+                    # Unwinds the adapter's decode loop instead of finishing the file
+                    raise InterruptedError("Transcription cancelled")
+                update = (progress, message or f"Transcribing... {int(progress * 100)}%")
+                if update != last_update:
+                    last_update = update
+                    self.signals.progress_updated.emit(*update)
             
+            audio = self.audio_file if isinstance(self.audio_file, PcmAudio) else str(self.audio_file)
             result = self.adapter.transcribe(
-                str(self.audio_file),
+                audio,
                 language=self.language,
                 progress_callback=progress_callback,
-                word_timestamps=self.word_timestamps
+                word_timestamps=self.word_timestamps,
+                beam_size=self.beam_size
             )
             
-            if self.isInterruptionRequested():
-                return
-            
-            if self.isInterruptionRequested():
-                return
-            
-            logger.info(f"Transcription completed: {len(result.text)} characters")
-            self.transcription_done.emit(result)
+            logger.info(f"Transcription completed: {result.text_length} characters")
+            self.signals.transcription_done.emit(result)
             
+        except InterruptedError:
+            logger.info(f"Transcription cancelled: {self.audio_file}")
         except Exception as e:
             logger.exception("Transcription failed")
-            self.error_occurred.emit(f"Transcription failed: {e}")
+            self.signals.error_occurred.emit(f"Transcription failed: {e}")
+        finally:
+            self.done.set()
 
 
 class TranscriptionService(QObject):
@@ -77,22 +101,36 @@ class TranscriptionService(QObject):
     def __init__(self):
         super().__init__()
         self.language: Optional[str] = None
-        self._transcription_thread: Optional[_TranscriptionThread] = None
+        self._task: Optional[_TranscriptionTask] = None
+        # Started tasks stay referenced until they finish, including cancelled ones
+        self._tasks: List[_TranscriptionTask] = []
+        # One persistent worker: jobs reuse its thread and never decode concurrently
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+        # Latest progress not yet forwarded; bursts collapse into one GUI update
+        self._pending_progress: Optional[Tuple[float, str]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(_PROGRESS_COALESCE_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
     def transcribe_file(
         self,
         adapter: TranscriptionAdapter,
-        audio_file: Path,
+        audio_file: Union[Path, PcmAudio],
         language: Optional[str] = None,
-        word_timestamps: bool = False
+        word_timestamps: bool = False,
+        beam_size: int = 5
     ) -> None:
         """Start transcription of an audio file.
         
         Args:
             adapter: Model adapter to use
-            audio_file: Path to audio file
+            audio_file: Path to audio file, or in-memory PcmAudio
             language: Language code (None for auto-detect)
             word_timestamps: If True, request word-level timestamps from adapter
+            beam_size: Decoder beam width (1 = greedy, fastest)
         """
         if not adapter:
             error_msg = "No model adapter available for transcription"
@@ -104,16 +142,20 @@ class TranscriptionService(QObject):
         logger.info(f"Transcription language: {transcription_language or 'auto-detect'}")
 
         try:
-            self._transcription_thread = _TranscriptionThread(
+            task = _TranscriptionTask(
                 adapter,
                 audio_file,
                 transcription_language,
-                word_timestamps=word_timestamps
+                word_timestamps=word_timestamps,
+                beam_size=beam_size
             )
-            self._transcription_thread.transcription_done.connect(self._on_transcription_done)
-            self._transcription_thread.error_occurred.connect(self._on_transcription_error)
-            self._transcription_thread.progress_updated.connect(self._on_progress_updated)
-            self._transcription_thread.start()
+            task.signals.transcription_done.connect(self._on_transcription_done)
+            task.signals.error_occurred.connect(self._on_transcription_error)
+            task.signals.progress_updated.connect(self._on_progress_updated)
+            self._tasks = [t for t in self._tasks if not t.done.is_set()]
+            self._tasks.append(task)
+            self._task = task
+            self._pool.start(task)
             self.transcription_started.emit()
         except Exception as e:
             logger.exception("Failed to start transcription thread")
@@ -121,17 +163,34 @@ class TranscriptionService(QObject):
 
     def _on_transcription_done(self, result: TranscriptionResult) -> None:
         """Handle transcription completion."""
-        logger.info(f"Transcription completed: {len(result.text)} characters")
+        # Deliver the final progress before completion so it cannot arrive afterwards
+        self._flush_progress()
+        logger.info(f"Transcription completed: {result.text_length} characters")
         self.transcription_completed.emit(result)
 
     def _on_transcription_error(self, error: str) -> None:
         """Handle transcription error."""
+        self._discard_progress()
         logger.error(f"Transcription error: {error}")
         self.transcription_error.emit(error)
 
     def _on_progress_updated(self, progress: float, message: str) -> None:
-        """Handle progress update."""
-        self.progress_updated.emit(progress, message)
+        """Handle progress update (forwarded at most every _PROGRESS_COALESCE_MS)."""
+        self._pending_progress = (progress, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        """Emit the pending progress update, if any."""
+        self._progress_timer.stop()
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            self.progress_updated.emit(*pending)
+
+    def _discard_progress(self) -> None:
+        """Drop any pending progress update."""
+        self._progress_timer.stop()
+        self._pending_progress = None
 
     def set_language(self, language: Optional[str]) -> None:
         """Set the language for transcription."""
@@ -139,17 +198,23 @@ class TranscriptionService(QObject):
         logger.info(f"TranscriptionService language set to: {self.language or 'auto-detect'}")
 
     def cancel(self) -> None:
-        """Cancel current transcription."""
-        if self._transcription_thread and self._transcription_thread.isRunning():
+        """Cancel current transcription.
+        
+        Returns immediately; the running job stops emitting and its result is
+        discarded. Queued jobs start once it has finished.
+        """
+        task = self._task
+        if task is not None and not task.cancelled.is_set():
             logger.info("Cancelling transcription")
-            self._transcription_thread.requestInterruption()
-            self._transcription_thread.wait(5000)
-            if self._transcription_thread.isRunning():
-                logger.warning("Transcription thread did not stop in time")
-                self._transcription_thread.terminate()
+            task.cancelled.set()
+            task.signals.blockSignals(True)
+        self._task = None
+        self._discard_progress()
 
     def cleanup(self) -> None:
         """Cleanup resources."""
         self.cancel()
+        if not self._pool.waitForDone(5000):
+            logger.warning("Transcription worker did not stop in time")
         logger.debug("TranscriptionService cleanup complete")
 
@@ -0,0 +1,66 @@
+"""Generic QRunnable for running (success, message) helpers off the GUI thread."""
+from __future__ import annotations
+
+import threading
+from typing import Callable, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TaskSignals(QObject):
+    """Signals for BackgroundTask (QRunnable is not a QObject)."""
+    finished = Signal(bool, str)
+    progress = Signal(str)
+    # (bytes downloaded, total bytes; 0 if unknown)
+    download_progress = Signal(int, int)
+
+
+class BackgroundTask(QRunnable):
+    """Runs a helper returning (success, message) on a thread pool.
+
+    The owner keeps a reference until finished has been handled. If a cancel
+    event is given and set (e.g. the window has closed), a task still queued never
+    starts and a running one does not report back; the helper itself cannot be
+    interrupted mid-way.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Tuple[bool, str]],
+        progress_signal: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        """Args:
+            fn: Helper to run
+            progress_signal: Name of the TaskSignals signal whose emit is passed to fn
+                as progress_callback, or None if fn takes no callback
+            cancel_event: Optional event that suppresses the run and its result
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = TaskSignals()
+        self.fn = fn
+        self.progress_signal = progress_signal
+        self.cancel_event = cancel_event
+
+    def _cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def run(self) -> None:
+        if self._cancelled():
+            return
+        try:
+            if self.progress_signal:
+                callback = getattr(self.signals, self.progress_signal).emit
+                success, msg = self.fn(progress_callback=callback)
+            else:
+                success, msg = self.fn()
+        except Exception as e:
+            logger.exception("Background task failed")
+            success, msg = False, str(e)
+        if not self._cancelled():
+            self.signals.finished.emit(success, msg)
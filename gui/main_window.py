@@ -1,75 +1,87 @@
 """Main window for Open Video Transcribe."""
 from __future__ import annotations
 
+import functools
+import importlib.util
+import os
+import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, NamedTuple, Optional, Tuple
 
-from PySide6.QtCore import Qt, Slot, QThread, Signal
+from PySide6.QtCore import Qt, Slot, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel, QFileDialog,
-    QMessageBox, QComboBox, QHBoxLayout, QGroupBox
+    QMessageBox, QComboBox, QHBoxLayout, QGroupBox, QCheckBox, QFormLayout
 )
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont
 
+from core.audio.converter import FFmpegConverter
 from core.controller import Controller
 from core.logging_config import get_logger
 from core.models.model_info import (
     get_models_sorted_by_rating,
-    get_model_info,
     is_model_cached,
     get_gpu_vram_mb,
     resolve_repo,
 )
 from config.manager import config_manager
+from gui.background_task import BackgroundTask
 from gui.progress_dialog import ProgressDialog
 from gui.settings_dialog import SettingsDialog
 
 logger = get_logger(__name__)
 
+# faster_whisper.utils.download_model, imported on first use (pulls in CTranslate2)
+_download_model_fn = None
 
-class ModelLoadThread(QThread):
-    """Thread to load model without blocking the GUI."""
-    finished = Signal(bool, str)
 
-    def __init__(self, controller, model_type: str, model_name: str, quantization: str, device: str):
-        super().__init__()
-        self.controller = controller
-        self.model_type = model_type
-        self.model_name = model_name
-        self.quantization = quantization
-        self.device = device
-
-    def run(self) -> None:
-        success = self.controller.load_model(
-            self.model_type,
-            self.model_name,
-            self.quantization,
-            self.device,
-        )
-        if success:
-            self.finished.emit(True, f"Model {self.model_name} ready")
-        else:
-            self.finished.emit(False, "Model load failed")
+def _enable_hf_transfer() -> None:
+    """Use the Rust hf_transfer downloader for Hub downloads when it is installed."""
+    if importlib.util.find_spec("hf_transfer") is None:
+        return
+    # An explicit user setting (e.g. "0") wins
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    # huggingface_hub reads the variable when imported; update it if already loaded
+    constants = sys.modules.get("huggingface_hub.constants")
+    if constants is not None and os.environ["HF_HUB_ENABLE_HF_TRANSFER"] == "1":
+        constants.HF_HUB_ENABLE_HF_TRANSFER = True
 
 
-class ModelDownloadThread(QThread):
-    """Thread to pre-download model without loading."""
-    finished = Signal(bool, str)
+def _get_download_model():
+    """Return faster_whisper's download_model, importing it once."""
+    global _download_model_fn
+    if _download_model_fn is None:
+        from faster_whisper.utils import download_model
+        _download_model_fn = download_model
+    return _download_model_fn
 
-    def __init__(self, model_id: str, quantization: str):
-        super().__init__()
-        self.model_id = model_id
-        self.quantization = quantization
 
-    def run(self) -> None:
-        try:
-            from faster_whisper.utils import download_model
-            repo_or_id, use_systran = resolve_repo(self.model_id, self.quantization)
-            download_model(repo_or_id)
-            self.finished.emit(True, f"Model {self.model_id} downloaded successfully")
-        except Exception as e:
-            logger.exception("Model download failed")
-            self.finished.emit(False, str(e))
+def _warm_download_model() -> None:
+    """Pay the faster_whisper import cost off the GUI thread, before the first click."""
+    try:
+        _get_download_model()
+    except ImportError as e:
+        logger.debug(f"Skipping download_model warm-up: {e}")
+
+
+def _load_model_job(controller, model_type: str, model_name: str,
+                    quantization: str, device: str, persist: bool) -> Tuple[bool, str]:
+    """Load a model through the controller; run as a BackgroundTask."""
+    if controller.load_model(model_type, model_name, quantization, device, persist=persist):
+        return True, f"Model {model_name} ready"
+    return False, "Model load failed"
+
+
+def _download_model_job(model_id: str, quantization: str) -> Tuple[bool, str]:
+    """Pre-download a model without loading it; run as a BackgroundTask.
+
+    A running download cannot be interrupted (download_model offers no hook for it).
+    """
+    download_model = _get_download_model()
+    repo_or_id, _use_systran = resolve_repo(model_id, quantization)
+    download_model(repo_or_id)
+    return True, f"Model {model_id} downloaded successfully"
 
 
 WHISPER_LANGUAGES = [
@@ -81,6 +93,67 @@ WHISPER_LANGUAGES = [
     ("cs", "Czech"), ("hu", "Hungarian"), ("fi", "Finnish"), ("ro", "Romanian")
 ]
 
+# How long closeEvent waits for a running model load/download
+_CLOSE_WAIT_MS = 500
+
+# Point size of the status line at the top of the window
+_STATUS_FONT_SIZE = 12
+
+
+@functools.lru_cache(maxsize=1)
+def _status_font() -> QFont:
+    """Shared status label font (built lazily: QFont needs a QApplication)."""
+    font = QFont()
+    font.setPointSize(_STATUS_FONT_SIZE)
+    return font
+
+
+def _hf_cache_mtime() -> Optional[float]:
+    """Modification time of the HuggingFace hub cache root, or None if unavailable."""
+    try:
+        from huggingface_hub.constants import HF_HUB_CACHE
+        return os.stat(HF_HUB_CACHE).st_mtime
+    except (ImportError, OSError):
+        return None
+
+
+class _ModelRow(NamedTuple):
+    """Display strings for one model, derived from the static metadata table."""
+    id: str
+    combo_display: str
+    description: str
+    description_with_rating: str
+    vram_mb: int
+
+
+@functools.lru_cache(maxsize=1)
+def _models() -> Tuple[_ModelRow, ...]:
+    """Model rows sorted by rating, built once per process."""
+    return tuple(
+        _ModelRow(
+            info.id,
+            info.combo_display(),
+            info.description,
+            info.description_with_rating(),
+            info.vram_mb,
+        )
+        for info in get_models_sorted_by_rating()
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _models_by_id() -> Dict[str, _ModelRow]:
+    """Model id -> row, for O(1) lookups on selection changes."""
+    return {row.id: row for row in _models()}
+
+
+# Quality presets: (label, decoder beam size); beam 1 is greedy decoding
+QUALITY_PRESETS = [
+    ("Fast (greedy)", 1),
+    ("Balanced", 3),
+    ("Best", 5),
+]
+
 
 class MainWindow(QWidget):
     """Main application window."""
@@ -88,14 +161,37 @@ class MainWindow(QWidget):
     def __init__(self, cuda_available: bool = False):
         super().__init__()
         
+        # Before any load or download job can import huggingface_hub
+        _enable_hf_transfer()
         self.controller = Controller(cuda_available=cuda_available)
         self.cuda_available = cuda_available
-        self.progress_dialog: ProgressDialog = None
-        self._load_thread: Optional[ModelLoadThread] = None
-        self._download_thread: Optional[ModelDownloadThread] = None
+        # One dialog reused for loads, downloads and transcriptions (shown/hidden,
+        # never recreated); _progress_open tracks whether an operation owns it
+        self.progress_dialog = ProgressDialog(self)
+        self.progress_dialog.hide()
+        self._progress_open = False
+        # Transcription mode chooser, built on first use; buttons are
+        # (full, test, lyrics, cancel) and compared by identity after exec()
+        self._mode_msg_box: Optional[QMessageBox] = None
+        self._mode_buttons: Tuple[QPushButton, ...] = ()
+        # Model load/download jobs share the global pool's reusable threads
+        self._pool = QThreadPool.globalInstance()
+        self._load_task: Optional[BackgroundTask] = None
+        self._download_task: Optional[BackgroundTask] = None
+        # Set on close so model jobs stop reporting back to a closing window
+        self._cancel_event = threading.Event()
+        # (model_id, quantization) -> (repo_or_id, is cached); cleared after downloads/loads
+        self._cache_status: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+        # HF cache root mtime when _cache_status was last valid; a change means
+        # a repo was added or removed outside this window
+        self._cache_mtime: Optional[float] = None
+        # GPU VRAM does not change during a session; queried once
+        self._gpu_vram_mb: Optional[int] = get_gpu_vram_mb()
+        # model id -> " Your GPU: ... MB (...)." description suffix ("" if unknown)
+        self._vram_suffix: Dict[str, str] = self._build_vram_suffixes(self._gpu_vram_mb)
         
         self.setWindowTitle("Open Video Transcribe")
-        self.setFixedSize(500, 480)
+        self.setFixedSize(500, 540)
         
         # Enable drag and drop
         self.setAcceptDrops(True)
@@ -104,9 +200,7 @@ class MainWindow(QWidget):
         
         self.status_label = QLabel("Ready")
         self.status_label.setAlignment(Qt.AlignCenter)
-        font = self.status_label.font()
-        font.setPointSize(12)
-        self.status_label.setFont(font)
+        self.status_label.setFont(_status_font())
         layout.addWidget(self.status_label)
         
         self.select_file_button = QPushButton("Select Video/Audio File")
@@ -114,48 +208,58 @@ class MainWindow(QWidget):
         layout.addWidget(self.select_file_button)
         
         model_group = QGroupBox("Model Settings")
-        model_layout = QVBoxLayout()
+        # One form layout per group instead of an HBox row (plus label) per setting
+        model_form = QFormLayout()
         
-        model_row = QHBoxLayout()
-        model_row.addWidget(QLabel("Model:"))
         self.model_combo = QComboBox()
-        for info in get_models_sorted_by_rating():
-            self.model_combo.addItem(info.combo_display(), info.id)
+        # model id -> combo index, so config sync needs no itemData() scan
+        self._model_index = {}
+        for row in _models():
+            self._model_index[row.id] = self.model_combo.count()
+            self.model_combo.addItem(row.combo_display, row.id)
         self.model_combo.currentIndexChanged.connect(self._on_model_selection_changed)
-        model_row.addWidget(self.model_combo)
-        model_layout.addLayout(model_row)
+        model_form.addRow("Model:", self.model_combo)
         
         self.model_desc_label = QLabel("")
         self.model_desc_label.setWordWrap(True)
         self.model_desc_label.setStyleSheet("color: gray; font-size: 11px;")
-        model_layout.addWidget(self.model_desc_label)
+        model_form.addRow(self.model_desc_label)
         
-        quant_row = QHBoxLayout()
-        quant_row.addWidget(QLabel("Quantization:"))
         self.quant_combo = QComboBox()
-        self.quant_combo.addItems(["float16", "float32", "int8"])
+        self.quant_combo.addItems(["float16", "int8_float16", "bfloat16", "float32", "int8"])
         self.quant_combo.currentIndexChanged.connect(self._on_model_selection_changed)
-        quant_row.addWidget(self.quant_combo)
-        model_layout.addLayout(quant_row)
+        model_form.addRow("Quantization:", self.quant_combo)
         
-        device_row = QHBoxLayout()
-        device_row.addWidget(QLabel("Device:"))
         self.device_combo = QComboBox()
         self.device_combo.addItems(["cuda", "cpu"] if cuda_available else ["cpu"])
-        device_row.addWidget(self.device_combo)
-        model_layout.addLayout(device_row)
+        model_form.addRow("Device:", self.device_combo)
+        
+        self.quality_combo = QComboBox()
+        for label, beam_size in QUALITY_PRESETS:
+            self.quality_combo.addItem(label, beam_size)
+        self.quality_combo.setToolTip("Fast uses greedy decoding; Best uses beam search (beam size 5)")
+        self.quality_combo.activated.connect(self._on_quality_changed)
+        model_form.addRow("Quality:", self.quality_combo)
+        
+        self.context_checkbox = QCheckBox("Use previous text as context (slower)")
+        self.context_checkbox.setToolTip(
+            "Condition each segment on the previous transcript for more consistent wording"
+        )
+        self.context_checkbox.toggled.connect(self._on_context_toggled)
+        model_form.addRow(self.context_checkbox)
         
-        model_group.setLayout(model_layout)
+        model_group.setLayout(model_form)
         layout.addWidget(model_group)
         
         lang_group = QGroupBox("Language")
-        lang_layout = QHBoxLayout()
-        lang_layout.addWidget(QLabel("Input Language:"))
+        lang_form = QFormLayout()
         self.language_combo = QComboBox()
         for code, name in WHISPER_LANGUAGES:
             self.language_combo.addItem(name, code)
-        lang_layout.addWidget(self.language_combo)
-        lang_group.setLayout(lang_layout)
+        # language code -> combo index (same order as WHISPER_LANGUAGES)
+        self._lang_index = {code: i for i, (code, _name) in enumerate(WHISPER_LANGUAGES)}
+        lang_form.addRow("Input Language:", self.language_combo)
+        lang_group.setLayout(lang_form)
         layout.addWidget(lang_group)
         
         button_row = QHBoxLayout()
@@ -176,7 +280,10 @@ class MainWindow(QWidget):
         
         self._connect_signals()
         self._load_config()
-        self._on_model_selection_changed()
+
+        # Deferred until the event loop runs so the window shows first
+        QTimer.singleShot(0, self._load_startup_model)
+        QTimer.singleShot(0, lambda: self._pool.start(_warm_download_model))
         
         logger.info("MainWindow initialized")
     
@@ -194,81 +301,127 @@ class MainWindow(QWidget):
         if not model_id:
             self.model_desc_label.setText("")
             return
-        info = get_model_info(model_id)
+        info = _models_by_id().get(model_id)
         if not info:
             self.model_desc_label.setText("")
             return
-        desc = info.description_with_rating()
-        gpu_vram = get_gpu_vram_mb()
-        if gpu_vram is not None and info.vram_mb > 0:
-            status = "OK" if gpu_vram >= info.vram_mb else "may be tight"
-            desc += f" Your GPU: {gpu_vram} MB ({status})."
-        quant = self.quant_combo.currentText()
-        repo_or_id, _ = resolve_repo(model_id, quant)
-        if is_model_cached(repo_or_id):
+        desc = info.description_with_rating + self._vram_suffix.get(model_id, "")
+        _, cached = self._lookup_cache(model_id, self.quant_combo.currentText())
+        if cached:
             desc += " [Cached]"
         self.model_desc_label.setText(desc)
         self.model_combo.setToolTip(info.description)
 
+    @staticmethod
+    def _build_vram_suffixes(gpu_vram: Optional[int]) -> Dict[str, str]:
+        """Precompute the GPU fit note appended to each model description."""
+        suffixes: Dict[str, str] = {}
+        if gpu_vram is None:
+            return suffixes
+        for row in _models():
+            if row.vram_mb > 0:
+                status = "OK" if gpu_vram >= row.vram_mb else "may be tight"
+                suffixes[row.id] = f" Your GPU: {gpu_vram} MB ({status})."
+        return suffixes
+
+    def _lookup_cache(self, model_id: str, quantization: str) -> Tuple[str, bool]:
+        """Resolve repo and HF cache status once per (model, quantization).
+        
+        is_model_cached scans the HuggingFace cache on disk, which stutters the UI
+        on slow or network filesystems if repeated on every combo change. A single
+        stat of the cache root detects repos added or removed by other processes.
+        """
+        mtime = _hf_cache_mtime()
+        if mtime != self._cache_mtime:
+            self._cache_mtime = mtime
+            self._cache_status.clear()
+        key = (model_id, quantization)
+        status = self._cache_status.get(key)
+        if status is None:
+            repo_or_id, _ = resolve_repo(model_id, quantization)
+            status = self._cache_status[key] = (repo_or_id, is_model_cached(repo_or_id))
+        return status
+
     def _load_config(self) -> None:
         """Load configuration."""
-        model_name = self.controller.current_model_name or "large-v3"
-        found = False
-        for i in range(self.model_combo.count()):
-            if self.model_combo.itemData(i) == model_name:
-                self.model_combo.setCurrentIndex(i)
-                found = True
-                break
-        if not found:
-            self.model_combo.setCurrentIndex(0)
-        
-        quantization = config_manager.get_value("model.quantization", "float16")
+        # Each setCurrentIndex on these combos would refresh the model description
+        # (and cache status); block them and refresh once at the end instead
+        self.model_combo.blockSignals(True)
+        self.quant_combo.blockSignals(True)
+        try:
+            self._apply_config()
+        finally:
+            self.model_combo.blockSignals(False)
+            self.quant_combo.blockSignals(False)
+        self._on_model_selection_changed()
+    
+    def _apply_config(self) -> None:
+        """Set widget states from the saved configuration (signals handled by caller)."""
+        # The model the controller will load at startup (saved config, CUDA auto-enabled)
+        _model_type, startup_name, quantization, device = self.controller.startup_model
+        model_name = self.controller.current_model_name or startup_name
+        self.model_combo.setCurrentIndex(self._model_index.get(model_name, 0))
+        
+        cfg = config_manager.snapshot()
         index = self.quant_combo.findText(quantization)
         if index >= 0:
             self.quant_combo.setCurrentIndex(index)
         
-        device = config_manager.get_value("model.device", "cuda" if self.cuda_available else "cpu")
         index = self.device_combo.findText(device)
         if index >= 0:
             self.device_combo.setCurrentIndex(index)
         
-        language = config_manager.get_value("languages.input", "auto")
-        for i in range(self.language_combo.count()):
-            if self.language_combo.itemData(i) == language:
-                self.language_combo.setCurrentIndex(i)
-                break
+        language = cfg.get("languages.input", "auto")
+        index = self._lang_index.get(language)
+        if index is not None:
+            self.language_combo.setCurrentIndex(index)
+        
+        index = self.quality_combo.findData(self.controller.beam_size)
+        self.quality_combo.setCurrentIndex(index if index >= 0 else self.quality_combo.count() - 1)
+        
+        self.context_checkbox.blockSignals(True)
+        self.context_checkbox.setChecked(
+            cfg.get("transcription.condition_on_previous_text", False)
+        )
+        self.context_checkbox.blockSignals(False)
+    
+    @Slot(int)
+    def _on_quality_changed(self, index: int) -> None:
+        """Apply the selected quality preset (decoder beam size)."""
+        self.controller.set_beam_size(self.quality_combo.itemData(index))
+    
+    @Slot(bool)
+    def _on_context_toggled(self, checked: bool) -> None:
+        """Persist whether decoding is conditioned on previous text."""
+        config_manager.set_value("transcription.condition_on_previous_text", checked)
     
     @Slot()
     def _select_file(self) -> None:
         """Select video or audio file for transcription."""
+        # Starting in the last used folder avoids listing the CWD (slow on network shares)
+        start_dir = config_manager.get_value("ui.last_dir", str(Path.home()))
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Video or Audio File",
-            "",
+            start_dir,
             "Video Files (*.mp4 *.avi *.mkv *.webm *.mov);;"
             "Audio Files (*.mp3 *.wav *.m4a *.flac);;"
-            "All Files (*)"
+            "All Files (*)",
+            options=QFileDialog.ReadOnly,
         )
         
         if file_path:
             logger.info(f"Selected file: {file_path}")
-            self._ask_transcription_mode(Path(file_path))
+            path = Path(file_path)
+            config_manager.set_value("ui.last_dir", str(path.parent))
+            self._ask_transcription_mode(path)
     
     def _ask_transcription_mode(self, file_path: Path) -> None:
         """Ask user if they want full transcription, test mode, or lyrics extraction."""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Transcription Mode")
-        msg_box.setText("Choose transcription mode:")
-        msg_box.setInformativeText(
-            "Full File: Transcribe the entire file\n"
-            "Test Mode: Transcribe only first 5 minutes\n"
-            "Extract Lyrics: Word-level timestamps for MP3/WAV (format: START=END=WORD)"
-        )
-        
-        full_button = msg_box.addButton("Full File", QMessageBox.ButtonRole.AcceptRole)
-        test_button = msg_box.addButton("Test Mode (5 min)", QMessageBox.ButtonRole.AcceptRole)
-        lyrics_button = msg_box.addButton("Extract Lyrics", QMessageBox.ButtonRole.AcceptRole)
-        cancel_button = msg_box.addButton("Cancel", QMessageBox.ButtonRole.RejectRole)
+        if self._mode_msg_box is None:
+            self._build_mode_msg_box()
+        msg_box = self._mode_msg_box
+        full_button, test_button, lyrics_button, cancel_button = self._mode_buttons
         
         msg_box.setDefaultButton(full_button)
         msg_box.exec()
@@ -286,39 +439,79 @@ class MainWindow(QWidget):
             logger.info("Starting full file transcription")
             self.controller.transcribe_file(file_path, test_mode=False)
     
+    def _build_mode_msg_box(self) -> None:
+        """Create the transcription mode dialog once; it is re-shown for every file."""
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("Transcription Mode")
+        msg_box.setText("Choose transcription mode:")
+        msg_box.setInformativeText(
+            "Full File: Transcribe the entire file\n"
+            "Test Mode: Transcribe only first 5 minutes\n"
+            "Extract Lyrics: Word-level timestamps for MP3/WAV (format: START=END=WORD)"
+        )
+        
+        self._mode_buttons = (
+            msg_box.addButton("Full File", QMessageBox.ButtonRole.AcceptRole),
+            msg_box.addButton("Test Mode (5 min)", QMessageBox.ButtonRole.AcceptRole),
+            msg_box.addButton("Extract Lyrics", QMessageBox.ButtonRole.AcceptRole),
+            msg_box.addButton("Cancel", QMessageBox.ButtonRole.RejectRole),
+        )
+        self._mode_msg_box = msg_box
+    
     @Slot()
     def _load_model(self) -> None:
         """Load transcription model (runs in background thread)."""
         model_id = self.model_combo.currentData()
         if not model_id:
             return
-        quantization = self.quant_combo.currentText()
-        device = self.device_combo.currentText()
-        
+        self._start_model_load(
+            "whisper", model_id, self.quant_combo.currentText(), self.device_combo.currentText()
+        )
+
+    def _load_startup_model(self) -> None:
+        """Load the configured model once the window is up, instead of during construction."""
+        # Controller reports load errors itself (error_occurred); no second dialog here
+        self._start_model_load(
+            *self.controller.startup_model,
+            report_failure=False,
+            persist=self.controller.startup_persist,
+        )
+
+    def _start_model_load(
+        self,
+        model_type: str,
+        model_id: str,
+        quantization: str,
+        device: str,
+        report_failure: bool = True,
+        persist: bool = True,
+    ) -> None:
+        """Run controller.load_model on the pool behind the progress dialog."""
         self._set_widgets_enabled(False)
-        if self.progress_dialog is None:
-            self.progress_dialog = ProgressDialog(self)
-        self.progress_dialog.setWindowTitle("Loading Model")
-        self.progress_dialog.update_progress(0.0, f"Loading {model_id}...")
-        self.progress_dialog.show()
-        
-        self._load_thread = ModelLoadThread(
-            self.controller, "whisper", model_id, quantization, device
+        self._open_progress("Loading Model", f"Loading {model_id}...")
+        
+        self._load_task = BackgroundTask(
+            functools.partial(
+                _load_model_job,
+                self.controller, model_type, model_id, quantization, device, persist,
+            ),
+            cancel_event=self._cancel_event,
         )
 
         def on_finished(success: bool, msg: str) -> None:
-            if self.progress_dialog:
-                self.progress_dialog.close()
-                self.progress_dialog = None
+            self._close_progress()
             self._set_widgets_enabled(True)
-            self._load_thread = None
+            self._load_task = None
             if success:
+                # Loading downloads missing weights, so cache status may have changed
+                self._cache_status.clear()
+                self._on_model_selection_changed()
                 self.status_label.setText(msg)
-            else:
+            elif report_failure:
                 QMessageBox.warning(self, "Load Failed", msg)
 
-        self._load_thread.finished.connect(on_finished)
-        self._load_thread.start()
+        self._load_task.signals.finished.connect(on_finished)
+        self._pool.start(self._load_task)
 
     @Slot()
     def _download_model(self) -> None:
@@ -329,34 +522,33 @@ class MainWindow(QWidget):
         quantization = self.quant_combo.currentText()
         
         self.download_model_button.setEnabled(False)
-        if self.progress_dialog is None:
-            self.progress_dialog = ProgressDialog(self)
-        self.progress_dialog.setWindowTitle("Download Model")
-        self.progress_dialog.update_progress(0.0, f"Downloading {model_id}...")
-        self.progress_dialog.show()
+        self._open_progress("Download Model", f"Downloading {model_id}...")
         
-        self._download_thread = ModelDownloadThread(model_id, quantization)
+        self._download_task = BackgroundTask(
+            functools.partial(_download_model_job, model_id, quantization),
+            cancel_event=self._cancel_event,
+        )
 
         def on_finished(success: bool, msg: str) -> None:
-            if self.progress_dialog:
-                self.progress_dialog.close()
-                self.progress_dialog = None
+            self._close_progress()
             self.download_model_button.setEnabled(True)
-            self._download_thread = None
+            self._download_task = None
             if success:
                 QMessageBox.information(self, "Download Complete", msg)
+                self._cache_status.pop((model_id, quantization), None)
                 self._on_model_selection_changed()
             else:
                 QMessageBox.warning(self, "Download Failed", msg)
 
-        self._download_thread.finished.connect(on_finished)
-        self._download_thread.start()
+        self._download_task.signals.finished.connect(on_finished)
+        self._pool.start(self._download_task)
     
     @Slot()
     def _show_settings(self) -> None:
         """Show settings dialog."""
         dialog = SettingsDialog(self)
         if dialog.exec():
+            self.controller.reload_output_settings()
             if self.controller.converter is None:
                 ffmpeg_path = config_manager.get_value("ffmpeg_path", "")
                 if ffmpeg_path:
@@ -376,18 +568,28 @@ class MainWindow(QWidget):
     @Slot(float, str)
     def _update_progress(self, progress: float, message: str) -> None:
         """Update progress."""
-        if self.progress_dialog is None:
-            self.progress_dialog = ProgressDialog(self)
-            self.progress_dialog.show()
+        if not self._progress_open:
+            self._open_progress("Transcribing...", "Initializing...")
         
         self.progress_dialog.update_progress(progress, message)
     
+    def _open_progress(self, title: str, message: str) -> None:
+        """Reset and show the shared progress dialog for a new operation."""
+        self.progress_dialog.reset()
+        self.progress_dialog.setWindowTitle(title)
+        self.progress_dialog.update_progress(0.0, message)
+        self.progress_dialog.show()
+        self._progress_open = True
+    
+    def _close_progress(self) -> None:
+        """Hide the shared progress dialog at the end of an operation."""
+        self.progress_dialog.hide()
+        self._progress_open = False
+    
     @Slot(str, Path)
     def _on_transcription_completed(self, text: str, output_path: Path) -> None:
         """Handle transcription completion."""
-        if self.progress_dialog:
-            self.progress_dialog.close()
-            self.progress_dialog = None
+        self._close_progress()
         
         QMessageBox.information(
             self,
@@ -399,6 +601,8 @@ class MainWindow(QWidget):
     @Slot(str, str)
     def _show_error(self, title: str, message: str) -> None:
         """Show error dialog."""
+        # Errors end the running operation; the next one starts from a reset dialog
+        self._close_progress()
         QMessageBox.critical(self, title, message)
     
     @Slot(bool)
@@ -411,55 +615,48 @@ class MainWindow(QWidget):
         self.model_combo.setEnabled(enabled)
         self.quant_combo.setEnabled(enabled)
         self.device_combo.setEnabled(enabled)
+        self.quality_combo.setEnabled(enabled)
+        self.context_checkbox.setEnabled(enabled)
         self.language_combo.setEnabled(enabled)
     
+    @staticmethod
+    def _first_accepted_path(urls) -> Optional[Path]:
+        """Return the first dropped URL that is an existing video/audio file."""
+        for url in urls:
+            local = url.toLocalFile()
+            # Suffix check on the raw string first: no Path construction, and
+            # is_file() (which hits the filesystem) only for candidate media files
+            suffix = os.path.splitext(local)[1]
+            if FFmpegConverter.classify_suffix(suffix) and os.path.isfile(local):
+                return Path(local)
+        return None
+    
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter event."""
-        if event.mimeData().hasUrls():
-            # Check if at least one file is a video or audio file
-            urls = event.mimeData().urls()
-            for url in urls:
-                file_path = Path(url.toLocalFile())
-                if file_path.is_file():
-                    suffix = file_path.suffix.lower()
-                    video_formats = [".mp4", ".avi", ".mkv", ".webm", ".mov", ".flv", ".wmv", ".m4v"]
-                    audio_formats = [".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"]
-                    if suffix in video_formats or suffix in audio_formats:
-                        event.acceptProposedAction()
-                        return
+        mime_data = event.mimeData()
+        if mime_data.hasUrls() and self._first_accepted_path(mime_data.urls()):
+            event.acceptProposedAction()
+            return
         event.ignore()
     
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop event."""
-        urls = event.mimeData().urls()
-        if not urls:
+        file_path = self._first_accepted_path(event.mimeData().urls())
+        if file_path is None:
+            event.ignore()
             return
-        
-        # Get the first valid file
-        for url in urls:
-            file_path = Path(url.toLocalFile())
-            if file_path.is_file():
-                suffix = file_path.suffix.lower()
-                video_formats = [".mp4", ".avi", ".mkv", ".webm", ".mov", ".flv", ".wmv", ".m4v"]
-                audio_formats = [".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"]
-                if suffix in video_formats or suffix in audio_formats:
-                    logger.info(f"Dropped file: {file_path}")
-                    self._ask_transcription_mode(file_path)
-                    event.acceptProposedAction()
-                    return
-        
-        event.ignore()
+        logger.info(f"Dropped file: {file_path}")
+        self._ask_transcription_mode(file_path)
+        event.acceptProposedAction()
     
     def closeEvent(self, event) -> None:
         """Handle window close."""
-        if self.progress_dialog:
-            self.progress_dialog.close()
-        if self._load_thread and self._load_thread.isRunning():
-            self._load_thread.requestInterruption()
-            self._load_thread.wait(5000)
-        if self._download_thread and self._download_thread.isRunning():
-            self._download_thread.requestInterruption()
-            self._download_thread.wait(5000)
+        self._close_progress()
+        self._cancel_event.set()
+        # Short grace period only: a running download cannot be interrupted, and
+        # blocking the close for seconds on it just looks like a hang
+        if (self._load_task or self._download_task) and not self._pool.waitForDone(_CLOSE_WAIT_MS):
+            logger.warning("Model load/download still running at exit; not waiting for it")
         self.controller.cleanup()
         logger.info("Application closing")
         super().closeEvent(event)
@@ -34,18 +34,33 @@ class ProgressDialog(QDialog):
         layout.addWidget(self.cancel_button)
         
         self.setWindowFlags(Qt.Dialog | Qt.WindowTitleHint | Qt.CustomizeWindowHint)
+
+        self._last_pct = -1
+    
+    def reset(self) -> None:
+        """Zero the bar and clear the label so the dialog can be reused."""
+        self._last_pct = -1
+        self.progress_bar.setValue(0)
+        self.status_label.setText("")
     
     def update_progress(self, progress: float, message: str) -> None:
         """Update progress bar and message.
+
+        The bar is only touched when the percentage changes, so fast segment
+        streams do not repaint it; the message is always applied.
         
         Args:
             progress: Progress value (0.0-1.0)
             message: Status message
         """
-        self.progress_bar.setValue(int(progress * 100))
-        self.status_label.setText(message)
+        pct = int(progress * 100)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress_bar.setValue(pct)
+        self.set_message(message)
     
     def set_message(self, message: str) -> None:
         """Set status message."""
-        self.status_label.setText(message)
+        if message != self.status_label.text():
+            self.status_label.setText(message)
 
@@ -1,10 +1,12 @@
 """Settings dialog for configuration."""
 from __future__ import annotations
 
-import platform
+import functools
+import os
 from pathlib import Path
+from typing import Optional, Set, Tuple
 
-from PySide6.QtCore import QThread, Signal, Slot
+from PySide6.QtCore import QThreadPool, QTimer, Slot
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFileDialog, QComboBox, QGroupBox, QMessageBox, QCheckBox,
@@ -12,29 +14,19 @@ from PySide6.QtWidgets import (
 )
 
 from config.manager import config_manager
+from core._platform import IS_WINDOWS
 from core.logging_config import get_logger
+from gui.background_task import BackgroundTask
 
 logger = get_logger(__name__)
 
+# Delay before the Save button shows that a slow FFmpeg path check is running
+_VALIDATION_HINT_MS = 300
 
-class FFmpegDownloadThread(QThread):
-    """Thread to download FFmpeg without blocking the GUI."""
-    finished = Signal(bool, str)
 
-    def run(self) -> None:
-        from core.ffmpeg_install import download_ffmpeg
-        success, msg = download_ffmpeg()
-        self.finished.emit(success, msg)
-
-
-class CudaInstallThread(QThread):
-    """Thread to install CUDA runtime via pip without blocking the GUI."""
-    finished = Signal(bool, str)
-
-    def run(self) -> None:
-        from core.cuda_install import install_cuda_redist
-        success, msg = install_cuda_redist()
-        self.finished.emit(success, msg)
+def _check_ffmpeg_path(path: str) -> Tuple[bool, str]:
+    """Return (is an executable file, path); stat() on unreachable network paths can block for seconds."""
+    return os.path.isfile(path) and os.access(path, os.X_OK), path
 
 
 class SettingsDialog(QDialog):
@@ -63,7 +55,7 @@ class SettingsDialog(QDialog):
         
         self.install_ffmpeg_button = QPushButton("Install FFmpeg")
         self.install_ffmpeg_button.clicked.connect(self._install_ffmpeg)
-        self.install_ffmpeg_button.setVisible(platform.system() == "Windows")
+        self.install_ffmpeg_button.setVisible(IS_WINDOWS)
         ffmpeg_row.addWidget(self.install_ffmpeg_button)
         
         ffmpeg_layout.addLayout(ffmpeg_row)
@@ -75,7 +67,7 @@ class SettingsDialog(QDialog):
         cuda_layout.addWidget(QLabel("If GPU fails with cublas64_12.dll error:"))
         self.install_cuda_button = QPushButton("Install CUDA Runtime (nvidia-cublas-cu12, nvidia-cudnn-cu12)")
         self.install_cuda_button.clicked.connect(self._install_cuda)
-        self.install_cuda_button.setVisible(platform.system() == "Windows")
+        self.install_cuda_button.setVisible(IS_WINDOWS)
         cuda_layout.addWidget(self.install_cuda_button)
         cuda_group.setLayout(cuda_layout)
         layout.addWidget(cuda_group)
@@ -113,9 +105,9 @@ class SettingsDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        save_button = QPushButton("Save")
-        save_button.clicked.connect(self._save_settings)
-        button_layout.addWidget(save_button)
+        self.save_button = QPushButton("Save")
+        self.save_button.clicked.connect(self._save_settings)
+        button_layout.addWidget(self.save_button)
         
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.reject)
@@ -123,41 +115,49 @@ class SettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
+        self._path_check_task: Optional[BackgroundTask] = None
+        # Tasks in flight (strong references until finished is handled)
+        self._tasks: Set[BackgroundTask] = set()
+        
         self._load_settings()
     
     def _load_settings(self) -> None:
         """Load current settings."""
-        ffmpeg_path = config_manager.get_value("ffmpeg_path", "")
+        cfg = config_manager.snapshot()
+        ffmpeg_path = cfg.get("ffmpeg_path", "")
         self.ffmpeg_path_edit.setText(ffmpeg_path)
         
-        output_format = config_manager.get_value("output.format", "txt")
+        output_format = cfg.get("output.format", "txt")
         index = self.format_combo.findText(output_format)
         if index >= 0:
             self.format_combo.setCurrentIndex(index)
         
-        include_timestamps = config_manager.get_value("output.include_timestamps", True)
+        include_timestamps = cfg.get("output.include_timestamps", True)
         self.include_timestamps_checkbox.setChecked(include_timestamps)
         
-        input_lang = config_manager.get_value("languages.input", "auto")
+        input_lang = cfg.get("languages.input", "auto")
         index = self.input_lang_combo.findText(input_lang)
         if index >= 0:
             self.input_lang_combo.setCurrentIndex(index)
     
     def _browse_ffmpeg(self) -> None:
         """Browse for FFmpeg executable."""
+        start_dir = config_manager.get_value("ui.last_ffmpeg_dir", str(Path.home()))
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select FFmpeg Executable",
-            "",
-            "Executable Files (*.exe);;All Files (*)"
+            start_dir,
+            "Executable Files (*.exe);;All Files (*)",
+            options=QFileDialog.ReadOnly,
         )
         if file_path:
             self.ffmpeg_path_edit.setText(file_path)
+            config_manager.set_value("ui.last_ffmpeg_dir", str(Path(file_path).parent))
 
     @Slot()
     def _install_ffmpeg(self) -> None:
         """Download and install FFmpeg (Windows only)."""
-        if platform.system() != "Windows":
+        if not IS_WINDOWS:
             QMessageBox.information(
                 self,
                 "Install FFmpeg",
@@ -169,8 +169,19 @@ class SettingsDialog(QDialog):
         progress.setWindowTitle("Install FFmpeg")
         progress.setModal(True)
         progress.show()
-        thread = FFmpegDownloadThread(self)
+        from core.ffmpeg_install import download_ffmpeg
+        task = BackgroundTask(download_ffmpeg, progress_signal="download_progress")
+        def on_progress(done: int, total: int) -> None:
+            if total > 0:
+                progress.setMaximum(total)
+                progress.setValue(done)
+                progress.setLabelText(
+                    f"Downloading FFmpeg... {done // 1048576} / {total // 1048576} MB"
+                )
+            else:
+                progress.setLabelText(f"Downloading FFmpeg... {done // 1048576} MB")
         def on_finished(success: bool, msg: str) -> None:
+            self._tasks.discard(task)
             progress.close()
             self.install_ffmpeg_button.setEnabled(True)
             if success:
@@ -187,13 +198,19 @@ class SettingsDialog(QDialog):
                     "Install Failed",
                     f"FFmpeg installation failed:\n{msg}"
                 )
-        thread.finished.connect(on_finished)
-        thread.start()
+        task.signals.download_progress.connect(on_progress)
+        task.signals.finished.connect(on_finished)
+        self._start_task(task)
+
+    def _start_task(self, task: BackgroundTask) -> None:
+        """Submit a task to the global pool, keeping it alive until it finishes."""
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
 
     @Slot()
     def _install_cuda(self) -> None:
         """Install CUDA runtime libraries via pip (Windows only)."""
-        if platform.system() != "Windows":
+        if not IS_WINDOWS:
             QMessageBox.information(self, "CUDA", "CUDA auto-install is only available on Windows.")
             return
         self.install_cuda_button.setEnabled(False)
@@ -201,9 +218,11 @@ class SettingsDialog(QDialog):
         progress.setWindowTitle("Install CUDA")
         progress.setModal(True)
         progress.show()
-        thread = CudaInstallThread(self)
+        from core.cuda_install import install_cuda_redist
+        task = BackgroundTask(install_cuda_redist, progress_signal="progress")
 
         def on_finished(success: bool, msg: str) -> None:
+            self._tasks.discard(task)
             progress.close()
             self.install_cuda_button.setEnabled(True)
             if success:
@@ -215,26 +234,60 @@ class SettingsDialog(QDialog):
             else:
                 QMessageBox.warning(self, "Install Failed", msg)
 
-        thread.finished.connect(on_finished)
-        thread.start()
+        task.signals.progress.connect(progress.setLabelText)
+        task.signals.finished.connect(on_finished)
+        self._start_task(task)
     
     def _save_settings(self) -> None:
-        """Save settings."""
+        """Save settings, validating the FFmpeg path off the GUI thread first."""
+        ffmpeg_path = self.ffmpeg_path_edit.text().strip()
+        if not ffmpeg_path:
+            self._persist_settings(ffmpeg_path)
+            return
+        if self._path_check_task is not None:
+            return
+        
+        self.save_button.setEnabled(False)
+        self._path_check_task = BackgroundTask(functools.partial(_check_ffmpeg_path, ffmpeg_path))
+        self._path_check_task.signals.finished.connect(self._on_ffmpeg_path_checked)
+        self._start_task(self._path_check_task)
+        QTimer.singleShot(_VALIDATION_HINT_MS, self._show_validation_hint)
+    
+    def _show_validation_hint(self) -> None:
+        """Tell the user why Save is disabled when the path check is slow."""
+        if self._path_check_task is not None:
+            self.save_button.setText("Checking FFmpeg path...")
+    
+    @Slot(bool, str)
+    def _on_ffmpeg_path_checked(self, valid: bool, ffmpeg_path: str) -> None:
+        """Persist settings once the FFmpeg path check has finished."""
+        self._tasks.discard(self._path_check_task)
+        self._path_check_task = None
+        self.save_button.setText("Save")
+        self.save_button.setEnabled(True)
+        if not self.isVisible():
+            # Dialog was cancelled while the check was running
+            return
+        if not valid:
+            QMessageBox.warning(self, "Error", "FFmpeg path does not exist or is not executable")
+            return
+        self._persist_settings(ffmpeg_path)
+    
+    def _persist_settings(self, ffmpeg_path: str) -> None:
+        """Write the dialog values to the configuration and close."""
         try:
-            ffmpeg_path = self.ffmpeg_path_edit.text().strip()
+            values = {
+                "output.format": self.format_combo.currentText(),
+                "output.include_timestamps": self.include_timestamps_checkbox.isChecked(),
+                "languages.input": self.input_lang_combo.currentText(),
+            }
             if ffmpeg_path:
-                if not Path(ffmpeg_path).exists():
-                    QMessageBox.warning(self, "Error", "FFmpeg path does not exist")
-                    return
-                config_manager.set_value("ffmpeg_path", ffmpeg_path)
-            
-            config_manager.set_value("output.format", self.format_combo.currentText())
-            config_manager.set_value("output.include_timestamps", self.include_timestamps_checkbox.isChecked())
-            config_manager.set_value("languages.input", self.input_lang_combo.currentText())
+                values["ffmpeg_path"] = ffmpeg_path
+            # One file write for all changed keys
+            config_manager.update_values(values)
             
             QMessageBox.information(self, "Success", "Settings saved successfully")
             self.accept()
         except Exception as e:
             logger.exception("Failed to save settings")
             QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
-
@@ -1,177 +1,330 @@
 """Installation script for Open Video Transcribe."""
+import ctypes
+import functools
+import http.client
+import os
+import re
 import sys
 import subprocess
-import os
 import platform
 import shutil
+import threading
+import urllib.error
+import urllib.parse
 import urllib.request
-import zipfile
-import tempfile
+import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Stdlib-only helpers shared with the app; resolved up front so a broken checkout
+# is reported before the long pip installs rather than after them
+try:
+    from core.cuda_install import install_cuda_redist
+    from core.ffmpeg_install import download_ffmpeg as _ffmpeg_download
+except ImportError as _core_import_error:
+    install_cuda_redist = _ffmpeg_download = None
+    print(f"Warning: could not import core helpers ({_core_import_error}); "
+          "FFmpeg and CUDA runtime setup will be skipped")
+
+# Flags for every pip install: the ~2GB CUDA torch wheel regularly exceeds pip's
+# default 15s read timeout on slow or flaky connections, and the progress bar's
+# redraws are slow through the Windows console (pip still logs each package)
+_PIP_INSTALL_FLAGS = ["--timeout", "1800", "--retries", "10", "--progress-bar", "off"]
+# Resume interrupted downloads instead of restarting them (pip >= 25.1, so only
+# used after pip itself has been upgraded)
+_PIP_RESUME_FLAGS = ["--resume-retries", "10"]
+
+# platform.system() runs uname() (or a registry lookup) per call; resolve once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+# Wheel tag of the running interpreter (e.g. "cp312")
+_PY_TAG = f"cp{sys.version_info.major}{sys.version_info.minor}"
+
+# Top-level ffmpeg_path line in config.yaml, edited in place by create_config_file
+_FFMPEG_PATH_RE = re.compile(r"^ffmpeg_path:[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+# Scalars that mean "not configured"
+_EMPTY_YAML_VALUES = frozenset({"", '""', "''", "~", "null"})
+
+# Upper bound for the nvidia-smi GPU probe
+_GPU_PROBE_TIMEOUT_S = 5
+# NVML ships with the NVIDIA driver; querying it in-process avoids starting nvidia-smi
+_NVML_LIBRARY = "nvml.dll" if _IS_WINDOWS else "libnvidia-ml.so.1"
+
+# CUDA 12.8 PyTorch wheels (win_amd64) by interpreter tag; other versions and
+# platforms get the stock torch
+_TORCH_CU128_WHEELS = {
+    "cp311": "https://download.pytorch.org/whl/cu128/torch-2.8.0%2Bcu128-cp311-cp311-win_amd64.whl",
+    "cp312": "https://download.pytorch.org/whl/cu128/torch-2.8.0%2Bcu128-cp312-cp312-win_amd64.whl",
+}
+
+# Local copy of the ~2.6GB CUDA torch wheel, so re-runs (and restarts after a
+# dropped connection) do not fetch it again from the start
+_WHEEL_DIR = Path(".wheels")
+_WHEEL_CHUNK = 1024 * 1024
+_WHEEL_TIMEOUT_S = 60
+
+# Skip pip's self-version check (an extra index request) on every invocation, and
+# fail instead of prompting if pip ever wants input
+_PIP_ENV = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_INPUT": "1"}
+
+# Serializes output from setup steps that run concurrently
+_print_lock = threading.Lock()
+
+def _print(*args, **kwargs):
+    """print() that does not interleave with other setup threads."""
+    with _print_lock:
+        print(*args, **kwargs)
+
 def check_python_version():
     """Check if Python version is 3.11, 3.12, or 3.13."""
-    major, minor = sys.version_info[:2]
-    if major == 3 and minor in [11, 12, 13]:
-        return True
-    return False
+    return (3, 11) <= sys.version_info[:2] <= (3, 13)
+
+def _nvml_device_count():
+    """Return the NVIDIA device count via NVML, or None if the library is unavailable."""
+    try:
+        nvml = ctypes.CDLL(_NVML_LIBRARY)
+        init, get_count, shutdown = (
+            nvml.nvmlInit_v2, nvml.nvmlDeviceGetCount_v2, nvml.nvmlShutdown
+        )
+    except (OSError, AttributeError):
+        return None
+    if init() != 0:
+        return 0
+    try:
+        count = ctypes.c_uint()
+        return count.value if get_count(ctypes.byref(count)) == 0 else 0
+    finally:
+        shutdown()
 
+@functools.lru_cache(maxsize=1)
 def has_nvidia_gpu():
-    """Check if NVIDIA GPU is available."""
+    """Check if NVIDIA GPU is available (probed once per run)."""
+    count = _nvml_device_count()
+    if count is not None:
+        return count > 0
     try:
+        # -L only lists devices; a hung driver must not stall the installer
         result = subprocess.run(
-            ["nvidia-smi"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            ["nvidia-smi", "-L"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=_GPU_PROBE_TIMEOUT_S,
         )
         return result.returncode == 0
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
 def create_venv():
     """Create virtual environment if it doesn't exist."""
     venv_path = Path("venv")
-    if venv_path.exists():
+    if os.path.isdir(venv_path):
         print("Virtual environment already exists")
         return True
     
     print("Creating virtual environment...")
     try:
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)
+        # In-process, with the same defaults as "python -m venv venv"
+        venv.EnvBuilder(with_pip=True, symlinks=not _IS_WINDOWS).create(venv_path)
         print("Virtual environment created successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Failed to create virtual environment: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def get_venv_python():
-    """Get path to venv Python executable."""
-    if platform.system() == "Windows":
+    """Get path to venv Python executable (the venv location is fixed for the run)."""
+    if _IS_WINDOWS:
         return Path("venv") / "Scripts" / "python.exe"
     else:
         return Path("venv") / "bin" / "python"
 
-def install_requirements():
-    """Install requirements in venv."""
-    venv_python = get_venv_python()
-    if not venv_python.exists():
-        print("Virtual environment Python not found")
+def _pip_install(venv_python, *args, resume=True):
+    """Run pip install in the venv with the robustness flags; raises CalledProcessError."""
+    cmd = [str(venv_python), "-m", "pip", "install", *_PIP_INSTALL_FLAGS]
+    if resume:
+        cmd += _PIP_RESUME_FLAGS
+    # No stdin: pip must never sit waiting for input (e.g. a credentials prompt)
+    subprocess.run(cmd + list(args), check=True, stdin=subprocess.DEVNULL, env=_PIP_ENV)
+
+def _cuda_torch_wheel(gpu_available):
+    """Return the CUDA PyTorch wheel URL for this interpreter, or None for the stock torch.
+
+    The pinned wheels are win_amd64 builds; elsewhere the PyPI torch is used (on
+    Linux it already ships with CUDA support).
+    """
+    if not gpu_available or not _IS_WINDOWS:
+        return None
+    return _TORCH_CU128_WHEELS.get(_PY_TAG)
+
+def _fetch_wheel(url, dest_dir=_WHEEL_DIR):
+    """Download a wheel into dest_dir once, resuming a partial download.
+
+    Args:
+        url: Wheel URL; its unquoted basename is the local file name
+        dest_dir: Directory holding downloaded wheels
+
+    Returns:
+        Path to the complete local wheel.
+
+    Raises:
+        OSError (including urllib.error.URLError) or http.client.HTTPException.
+    """
+    target = dest_dir / urllib.parse.unquote(url.rsplit("/", 1)[1])
+    if target.is_file():
+        return target
+    dest_dir.mkdir(exist_ok=True)
+    partial = target.with_name(target.name + ".part")
+    offset = partial.stat().st_size if partial.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    try:
+        response = urllib.request.urlopen(
+            urllib.request.Request(url, headers=headers), timeout=_WHEEL_TIMEOUT_S
+        )
+    except urllib.error.HTTPError as e:
+        if e.code != 416:
+            raise
+        # Range past the end: the partial file cannot be trusted, start over
+        partial.unlink()
+        return _fetch_wheel(url, dest_dir)
+    with response:
+        if response.status != 206:
+            offset = 0  # Server ignored the range and sent the whole file
+        expected = response.length
+        _print(f"Downloading {target.name} ({'resuming' if offset else 'starting'})...")
+        with open(partial, "ab" if offset else "wb") as out:
+            shutil.copyfileobj(response, out, _WHEEL_CHUNK)
+            received = out.tell() - offset
+    # A dropped connection looks like a normal end of stream; compare lengths
+    if expected is not None and received != expected:
+        raise OSError(f"download of {target.name} interrupted; re-run to resume")
+    partial.replace(target)
+    return target
+
+def install_requirements(venv_python, gpu_available):
+    """Install requirements and PyTorch (with CUDA support if available) in venv."""
+    _print("Installing requirements...")
+    try:
+        # Modern pip/setuptools/wheel first: resumable downloads and current wheel tags.
+        # Kept separate because the resume flags need the upgraded pip.
+        _pip_install(venv_python, "--upgrade", "pip", "setuptools", "wheel", resume=False)
+    except subprocess.CalledProcessError as e:
+        _print(f"Failed to install requirements: {e}")
         return False
     
-    print("Installing requirements...")
+    torch_wheel = _cuda_torch_wheel(gpu_available)
+    if torch_wheel:
+        # Resolved together with requirements.txt so the stock torch wheel is never
+        # downloaded only to be replaced
+        _print("Installing PyTorch with CUDA support...")
+        try:
+            torch_wheel = str(_fetch_wheel(torch_wheel))
+        except (OSError, http.client.HTTPException) as e:
+            _print(f"Could not cache the PyTorch wheel ({e}), letting pip download it")
+        try:
+            _pip_install(venv_python, "-r", "requirements.txt", torch_wheel)
+            _print("Requirements installed successfully (PyTorch with CUDA)")
+            return True
+        except subprocess.CalledProcessError:
+            _print("Failed to install PyTorch with CUDA, falling back to CPU version")
+    
     try:
-        subprocess.run([str(venv_python), "-m", "pip", "install", "--upgrade", "pip"], check=True)
-        subprocess.run([str(venv_python), "-m", "pip", "install", "-r", "requirements.txt"], check=True)
-        print("Requirements installed successfully")
+        _pip_install(venv_python, "-r", "requirements.txt")
+        _print("Requirements installed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Failed to install requirements: {e}")
+        _print(f"Failed to install requirements: {e}")
         return False
 
-def install_torch(gpu_available):
-    """Install PyTorch with appropriate CUDA support."""
-    venv_python = get_venv_python()
-    if not venv_python.exists():
+def install_cuda_runtime(gpu_available):
+    """Install CUDA runtime libraries (nvidia-cublas-cu12, nvidia-cudnn-cu12) on Windows GPUs."""
+    if not gpu_available or not _IS_WINDOWS:
         return False
-    
-    python_version = f"cp{sys.version_info.major}{sys.version_info.minor}"
-    
-    if gpu_available and python_version in ["cp311", "cp312"]:
-        print("Installing PyTorch with CUDA support...")
-        torch_urls = {
-            "cp311": "https://download.pytorch.org/whl/cu128/torch-2.8.0%2Bcu128-cp311-cp311-win_amd64.whl",
-            "cp312": "https://download.pytorch.org/whl/cu128/torch-2.8.0%2Bcu128-cp312-cp312-win_amd64.whl",
-        }
-        try:
-            subprocess.run([str(venv_python), "-m", "pip", "install", torch_urls[python_version]], check=True)
-            print("PyTorch with CUDA installed successfully")
-            if platform.system() == "Windows":
-                print("Installing CUDA runtime libraries (nvidia-cublas-cu12, nvidia-cudnn-cu12)...")
-                from core.cuda_install import install_cuda_redist
-                cuda_ok, cuda_msg = install_cuda_redist()
-                if cuda_ok:
-                    print(cuda_msg)
-                else:
-                    print(f"CUDA runtime install skipped or failed: {cuda_msg}")
-                    print("If GPU fails with cublas64_12.dll error, run Install CUDA in Settings.")
-        except subprocess.CalledProcessError:
-            print("Failed to install PyTorch with CUDA, falling back to CPU version")
-            subprocess.run([str(venv_python), "-m", "pip", "install", "torch"], check=True)
+    if install_cuda_redist is None:
+        return False
+    _print("Installing CUDA runtime libraries (nvidia-cublas-cu12, nvidia-cudnn-cu12)...")
+    cuda_ok, cuda_msg = install_cuda_redist()
+    if cuda_ok:
+        _print(cuda_msg)
     else:
-        print("Installing PyTorch (CPU version)...")
-        subprocess.run([str(venv_python), "-m", "pip", "install", "torch"], check=True)
-        if gpu_available and platform.system() == "Windows":
-            print("Installing CUDA runtime (nvidia-cublas-cu12, nvidia-cudnn-cu12)...")
-            from core.cuda_install import install_cuda_redist
-            cuda_ok, _ = install_cuda_redist()
-            if not cuda_ok:
-                print("CUDA runtime install failed. Use Settings > Install CUDA if GPU fails.")
-    
-    return True
+        _print(f"CUDA runtime install skipped or failed: {cuda_msg}")
+        _print("If GPU fails with cublas64_12.dll error, run Install CUDA in Settings.")
+    return cuda_ok
 
 def download_ffmpeg():
     """Download and extract FFmpeg if ffmpeg folder doesn't exist."""
-    if platform.system() == "Linux":
-        print("FFmpeg download for Linux not implemented.")
-        print("Please install FFmpeg using your package manager:")
-        print("  Ubuntu/Debian: sudo apt install ffmpeg")
-        print("  Fedora: sudo dnf install ffmpeg")
-        print("  Arch: sudo pacman -S ffmpeg")
+    if _SYSTEM == "Linux":
+        _print("FFmpeg download for Linux not implemented.")
+        _print("Please install FFmpeg using your package manager:")
+        _print("  Ubuntu/Debian: sudo apt install ffmpeg")
+        _print("  Fedora: sudo dnf install ffmpeg")
+        _print("  Arch: sudo pacman -S ffmpeg")
         return False
-    if platform.system() == "Darwin":
-        print("FFmpeg download for macOS not implemented.")
-        print("Please install FFmpeg using Homebrew:")
-        print("  brew install ffmpeg")
+    if _SYSTEM == "Darwin":
+        _print("FFmpeg download for macOS not implemented.")
+        _print("Please install FFmpeg using Homebrew:")
+        _print("  brew install ffmpeg")
         return False
-    if platform.system() != "Windows":
-        print(f"FFmpeg download not implemented for {platform.system()}")
+    if not _IS_WINDOWS:
+        _print(f"FFmpeg download not implemented for {_SYSTEM}")
         return False
 
-    print("Downloading FFmpeg for Windows...")
-    from core.ffmpeg_install import download_ffmpeg as _download
-    success, msg = _download()
+    if _ffmpeg_download is None:
+        return False
+    _print("Downloading FFmpeg for Windows...")
+    success, msg = _ffmpeg_download()
     if success:
-        print(msg)
+        _print(msg)
         return True
-    print(f"Error: {msg}")
+    _print(f"Error: {msg}")
     return False
 
+def _yaml_quote(value):
+    """Single-quote a YAML scalar (no backslash escapes, so Windows paths stay intact)."""
+    return "'" + value.replace("'", "''") + "'"
+
+def _configured_ffmpeg_path(text):
+    """Return the raw ffmpeg_path value in config text, or "" if unset."""
+    match = _FFMPEG_PATH_RE.search(text)
+    value = match.group(1) if match else ""
+    return "" if value in _EMPTY_YAML_VALUES else value
+
+def _with_ffmpeg_path(text, ffmpeg_path):
+    """Return config text with only the ffmpeg_path line replaced (comments are kept)."""
+    line = f"ffmpeg_path: {_yaml_quote(ffmpeg_path)}"
+    # Callable replacement: backslashes in the path must not be read as regex escapes
+    text, count = _FFMPEG_PATH_RE.subn(lambda _match: line, text, count=1)
+    return text if count else line + "\n" + text
+
+def _set_config_ffmpeg_path(config_path, ffmpeg_path, text=None):
+    """Write config text (read from config_path if not given) with ffmpeg_path set."""
+    if text is None:
+        text = config_path.read_text(encoding="utf-8")
+    config_path.write_text(_with_ffmpeg_path(text, ffmpeg_path), encoding="utf-8")
+    print(f"Updated config.yaml with FFmpeg path: {ffmpeg_path}")
+
 def create_config_file():
     """Create config.yaml from sample if it doesn't exist."""
     config_path = Path("config.yaml")
     sample_path = Path("config.yaml.sample")
+    ffmpeg_exe = Path("ffmpeg") / "bin" / "ffmpeg.exe"
+    # Path of a downloaded FFmpeg, checked once for all branches below
+    ffmpeg_path = str(ffmpeg_exe.absolute()) if os.path.isfile(ffmpeg_exe) else ""
     
-    if config_path.exists():
+    if os.path.isfile(config_path):
         print("config.yaml already exists")
-        # Check if FFmpeg path should be updated
+        # If ffmpeg_path is empty and we have downloaded FFmpeg, update it
         try:
-            import yaml
-            with config_path.open() as f:
-                config = yaml.safe_load(f) or {}
-            
-            ffmpeg_path = config.get("ffmpeg_path", "")
-            ffmpeg_exe = Path("ffmpeg") / "bin" / "ffmpeg.exe"
-            
-            # If ffmpeg_path is empty and we have downloaded FFmpeg, update it
-            if not ffmpeg_path and ffmpeg_exe.exists():
-                config["ffmpeg_path"] = str(ffmpeg_exe.absolute())
-                with config_path.open("w") as f:
-                    yaml.safe_dump(config, f, sort_keys=False, default_flow_style=False)
-                print(f"Updated config.yaml with FFmpeg path: {config['ffmpeg_path']}")
-        except ImportError:
-            # PyYAML not available yet, that's okay
-            pass
+            text = config_path.read_text(encoding="utf-8")
+            if ffmpeg_path and not _configured_ffmpeg_path(text):
+                _set_config_ffmpeg_path(config_path, ffmpeg_path, text)
         except Exception as e:
             print(f"Warning: Could not update config.yaml: {e}")
         return True
     
-    if not sample_path.exists():
+    if not os.path.isfile(sample_path):
         print("Warning: config.yaml.sample not found, creating default config.yaml")
-        # Check if we have downloaded FFmpeg
-        ffmpeg_exe = Path("ffmpeg") / "bin" / "ffmpeg.exe"
-        ffmpeg_path = str(ffmpeg_exe.absolute()) if ffmpeg_exe.exists() else ""
-        
-        default_config = f"""ffmpeg_path: "{ffmpeg_path}"
+        default_config = f"""ffmpeg_path: {_yaml_quote(ffmpeg_path)}
 model:
   type: whisper
   name: large-v3
@@ -192,35 +345,42 @@ output:
         return True
     
     try:
-        shutil.copy(sample_path, config_path)
+        # Sample text is patched in memory so config.yaml is written exactly once
+        text = sample_path.read_text(encoding="utf-8")
+        if ffmpeg_path:
+            text = _with_ffmpeg_path(text, ffmpeg_path)
+        config_path.write_text(text, encoding="utf-8")
         print("Created config.yaml from config.yaml.sample")
-        
-        # Update FFmpeg path if we downloaded it
-        ffmpeg_exe = Path("ffmpeg") / "bin" / "ffmpeg.exe"
-        if ffmpeg_exe.exists():
-            try:
-                import yaml
-                with config_path.open() as f:
-                    config = yaml.safe_load(f) or {}
-                config["ffmpeg_path"] = str(ffmpeg_exe.absolute())
-                with config_path.open("w") as f:
-                    yaml.safe_dump(config, f, sort_keys=False, default_flow_style=False)
-                print(f"Updated config.yaml with FFmpeg path: {config['ffmpeg_path']}")
-            except ImportError:
-                # PyYAML not available yet, that's okay - user can set path manually
-                print(f"Note: FFmpeg downloaded to {ffmpeg_exe.absolute()}")
-                print("      Please set ffmpeg_path in config.yaml manually")
-            except Exception as e:
-                print(f"Warning: Could not update FFmpeg path in config: {e}")
-        
+        if ffmpeg_path:
+            print(f"Updated config.yaml with FFmpeg path: {ffmpeg_path}")
         return True
     except Exception as e:
         print(f"Failed to create config.yaml: {e}")
         return False
 
+def _write_if_changed(path, content, mode=None):
+    """Write content to path unless it is already identical.
+
+    Rewriting unchanged scripts on every install re-triggers antivirus scans on Windows.
+    """
+    try:
+        unchanged = path.read_text() == content
+    except (OSError, UnicodeDecodeError):
+        unchanged = False
+    if not unchanged:
+        if mode is None:
+            path.write_text(content)
+        else:
+            # A newly created file gets its mode here, so the chmod below is skipped
+            fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, mode)
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+    if mode is not None and (path.stat().st_mode & 0o777) != mode:
+        path.chmod(mode)
+
 def generate_starter_scripts():
     """Generate starter scripts for Windows and Unix."""
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         run_bat = """@echo off
 if not exist venv\\Scripts\\python.exe (
     echo Virtual environment not found. Please run install.py first.
@@ -231,7 +391,7 @@ call venv\\Scripts\\activate.bat
 python main.py
 pause
 """
-        Path("run.bat").write_text(run_bat)
+        _write_if_changed(Path("run.bat"), run_bat)
         
         setup_bat = r"""@echo off
 cd /d "%~dp0"
@@ -362,8 +522,15 @@ goto end
 
 :search_python
 echo.
-echo Searching common locations for Python 3.11 and 3.12...
-powershell -NoProfile -Command "$paths = @('%%LocalAppData%%\\Programs\\Python\\Python312\\python.exe', '%%LocalAppData%%\\Programs\\Python\\Python311\\python.exe', 'C:\\Python312\\python.exe', 'C:\\Python311\\python.exe', '%%ProgramFiles%%\\Python312\\python.exe', '%%ProgramFiles%%\\Python311\\python.exe', '%%UserProfile%%\\AppData\\Local\\Programs\\Python\\Python312\\python.exe', '%%UserProfile%%\\AppData\\Local\\Programs\\Python\\Python311\\python.exe'); foreach ($p in $paths) { $exp = [Environment]::ExpandEnvironmentVariables($p); if (Test-Path $exp) { try { $v = & $exp -c 'import sys; print(sys.version_info.minor)' 2>$null; if ($v -match '^(11|12)$') { Write-Host 'FOUND:' $exp } } catch {} } }"
+echo Searching for installed Python 3.11 and 3.12...
+where py >nul 2>&1
+if %errorlevel% equ 0 (
+    py -0p 2>nul | findstr /R /C:"3\.1[12]"
+) else (
+    where python 2>nul
+    reg query "HKCU\SOFTWARE\Python\PythonCore" /s /v ExecutablePath 2>nul | findstr /I "python.exe"
+    reg query "HKLM\SOFTWARE\Python\PythonCore" /s /v ExecutablePath 2>nul | findstr /I "python.exe"
+)
 echo.
 echo If found above, use option [4] and paste the path.
 echo.
@@ -409,7 +576,7 @@ if exist "%ProgramFiles%\Python311\python.exe" (
 )
 goto :eof
 """
-        Path("setup.bat").write_text(setup_bat)
+        _write_if_changed(Path("setup.bat"), setup_bat)
     else:
         run_sh = """#!/bin/bash
 if [ ! -f venv/bin/python ]; then
@@ -419,16 +586,14 @@ fi
 source venv/bin/activate
 python main.py
 """
-        Path("run.sh").write_text(run_sh)
-        Path("run.sh").chmod(0o755)
+        _write_if_changed(Path("run.sh"), run_sh, mode=0o755)
         
         setup_sh = """#!/bin/bash
 python install.py
 """
-        Path("setup.sh").write_text(setup_sh)
-        Path("setup.sh").chmod(0o755)
+        _write_if_changed(Path("setup.sh"), setup_sh, mode=0o755)
     
-    print("Starter scripts generated")
+    _print("Starter scripts generated")
 
 def main():
     """Main installation function."""
@@ -449,25 +614,35 @@ def main():
     if not create_venv():
         sys.exit(1)
     
-    if not install_requirements():
-        sys.exit(1)
-    
-    if not install_torch(gpu_available):
+    # Checked once here; the install steps below take the path as given
+    venv_python = get_venv_python()
+    if not os.path.isfile(venv_python):
+        print("Error: Virtual environment Python not found")
         sys.exit(1)
     
-    # Download FFmpeg if not present
-    download_ffmpeg()
+    # The FFmpeg download and starter scripts are independent of the venv, so they
+    # overlap with the pip installs; pip steps stay sequential since they share
+    # one environment
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ffmpeg_future = executor.submit(download_ffmpeg)
+        scripts_future = executor.submit(generate_starter_scripts)
+        
+        if not install_requirements(venv_python, gpu_available):
+            sys.exit(1)
+        
+        install_cuda_runtime(gpu_available)
+        
+        scripts_future.result()
+        ffmpeg_future.result()
     
     # Create config file (will update FFmpeg path if downloaded)
     create_config_file()
     
-    generate_starter_scripts()
-    
     print("=" * 60)
     print("Installation completed successfully!")
     print("=" * 60)
     print("You can now run the application using:")
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         print("  run.bat")
     else:
         print("  ./run.sh")
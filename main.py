@@ -1,29 +1,53 @@
 """Application entry point for Open Video Transcribe."""
 from __future__ import annotations
 
+import ctypes
+import functools
+import importlib.metadata
+import importlib.util
+import os
 import sys
 import signal
+import subprocess
 import platform
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
 
+from core._platform import IS_WINDOWS
 from core.logging_config import setup_logging, get_logger
-from gui.main_window import MainWindow
 
 logger = get_logger(__name__)
 
+# Upper bound for nvidia-smi; its first call after boot can spend seconds in driver init
+_NVIDIA_SMI_TIMEOUT_S = 5
+# Set (to any non-empty value) to run on CPU without probing for CUDA, like --cpu
+_FORCE_CPU_ENV = "OVT_FORCE_CPU"
+# NVML ships with the NVIDIA driver and answers the name query in-process
+_NVML_LIBRARY = "nvml.dll" if IS_WINDOWS else "libnvidia-ml.so.1"
+# NVML_DEVICE_NAME_V2_BUFFER_SIZE
+_NVML_NAME_BUFFER_SIZE = 96
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> tuple[tuple[str, str], ...]:
+    """Platform details, collected once (platform() and processor() may run uname)."""
+    return (
+        ("platform", platform.platform()),
+        ("python_version", platform.python_version()),
+        ("architecture", platform.machine()),
+        ("processor", platform.processor()),
+    )
+
 
 def _get_system_info() -> dict[str, str]:
     """Collect system information for debugging."""
-    info = {
-        "platform": platform.platform(),
-        "python_version": platform.python_version(),
-        "architecture": platform.machine(),
-        "processor": platform.processor(),
-    }
+    info = dict(_platform_info())
+    info["working_directory"] = str(Path.cwd())
+    info["script_location"] = str(Path(__file__).parent.absolute())
     
     try:
         from PySide6 import __version__ as pyside_version
@@ -31,18 +55,21 @@ def _get_system_info() -> dict[str, str]:
     except ImportError:
         info["pyside6_version"] = "Not installed"
     
+    # Package metadata only: importing torch just to read its version is slow
     try:
-        import torch
-        info["torch_version"] = torch.__version__
-        info["cuda_available"] = str(torch.cuda.is_available())
-        if torch.cuda.is_available():
-            info["cuda_version"] = torch.version.cuda or "Unknown"
-            info["cuda_device_count"] = str(torch.cuda.device_count())
-            if torch.cuda.device_count() > 0:
-                info["cuda_device_name"] = torch.cuda.get_device_name(0)
-    except ImportError:
+        info["torch_version"] = importlib.metadata.version("torch")
+    except importlib.metadata.PackageNotFoundError:
         info["torch_version"] = "Not installed"
-        info["cuda_available"] = "False"
+    
+    # CTranslate2 is what transcription actually runs on
+    try:
+        import ctranslate2
+        info["ctranslate2_version"] = ctranslate2.__version__
+        info["cuda_device_count"] = str(ctranslate2.get_cuda_device_count())
+    except ImportError:
+        info["ctranslate2_version"] = "Not installed"
+    except Exception as e:
+        info["cuda_device_count"] = f"Unknown ({e})"
     
     return info
 
@@ -53,13 +80,19 @@ def _log_system_info() -> None:
     logger.info("Starting Open Video Transcribe")
     logger.info("=" * 60)
     
-    system_info = _get_system_info()
-    for key, value in system_info.items():
-        logger.debug(f"{key}: {value}")
-    
-    logger.info(f"Working directory: {Path.cwd()}")
     logger.info(f"Python executable: {sys.executable}")
-    logger.info(f"Script location: {Path(__file__).parent.absolute()}")
+
+
+def _log_debug_system_info() -> None:
+    """Log detailed system information when debug logging is enabled.
+
+    Scheduled after the main window is shown: collecting it imports CTranslate2,
+    which is slow to load.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        system_info = _get_system_info()
+        for key, value in system_info.items():
+            logger.debug("%s: %s", key, value)
 
 
 def _install_sigint_handler() -> None:
@@ -82,32 +115,72 @@ def _check_dependencies() -> tuple[bool, list[str]]:
         missing.append("PySide6")
         logger.error("PySide6 is not installed")
     
-    try:
-        import faster_whisper
+    # find_spec checks presence without importing faster_whisper (and CTranslate2);
+    # the real import is deferred to WhisperAdapter.load_model
+    if importlib.util.find_spec("faster_whisper") is not None:
         logger.debug("faster-whisper is available")
-    except ImportError:
+    else:
         missing.append("faster-whisper")
         logger.warning("faster-whisper is not installed")
     
     return len(missing) == 0, missing
 
 
-def _check_cuda_availability() -> tuple[bool, str]:
-    """Check CUDA availability. Uses CTranslate2 runtime; falls back to nvidia-smi for GPU presence."""
-    import subprocess
+def _nvml_gpu_name() -> str | None:
+    """Get first NVIDIA GPU name via NVML, or None if there is no usable GPU.
 
-    def _nvidia_gpu_name() -> str | None:
-        """Get first NVIDIA GPU name via nvidia-smi, or None."""
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-                capture_output=True, text=True, timeout=5,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split("\n")[0]
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    Raises:
+        OSError: If the NVML library (or one of its functions) is unavailable.
+    """
+    nvml = ctypes.CDLL(_NVML_LIBRARY)
+    try:
+        init, shutdown = nvml.nvmlInit_v2, nvml.nvmlShutdown
+        get_handle, get_name = nvml.nvmlDeviceGetHandleByIndex_v2, nvml.nvmlDeviceGetName
+    except AttributeError as e:
+        raise OSError(str(e)) from e
+    if init() != 0:
+        return None
+    try:
+        handle = ctypes.c_void_p()
+        if get_handle(0, ctypes.byref(handle)) != 0:
+            return None
+        name = ctypes.create_string_buffer(_NVML_NAME_BUFFER_SIZE)
+        if get_name(handle, name, _NVML_NAME_BUFFER_SIZE) != 0:
+            return None
+        return name.value.decode(errors="replace") or None
+    finally:
+        shutdown()
+
+
+@functools.lru_cache(maxsize=1)
+def _nvidia_gpu_name() -> str | None:
+    """Get first NVIDIA GPU name, or None (probed once per process).
+
+    Uses NVML directly; nvidia-smi is only started if NVML cannot be loaded.
+    """
+    try:
+        return _nvml_gpu_name()
+    except OSError as e:
+        logger.debug("NVML unavailable, falling back to nvidia-smi: %s", e)
+    try:
+        # Only GPU 0 is reported, so only GPU 0 is queried; stderr is never read
+        output = subprocess.check_output(
+            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader", "--id=0"],
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=_NVIDIA_SMI_TIMEOUT_S,
+        )
+    except (OSError, subprocess.SubprocessError):
         return None
+    lines = output.decode(errors="replace").strip().splitlines()
+    return lines[0] if lines else None
+
+
+def _check_cuda_availability() -> tuple[bool, str]:
+    """Check CUDA availability via the CTranslate2 runtime; nvidia-smi/NVML only detect GPU presence."""
+    if "--cpu" in sys.argv or os.environ.get(_FORCE_CPU_ENV):
+        logger.info("CPU forced - skipping CUDA detection")
+        return False, "CPU (forced)"
 
     # CTranslate2 (used by faster-whisper) is the source of truth for GPU support
     try:
@@ -120,21 +193,7 @@ def _check_cuda_availability() -> tuple[bool, str]:
                 logger.info(f"CTranslate2 CUDA available - Devices: {count}, Device: {gpu_name}")
                 return True, f"CUDA ({gpu_name})"
     except Exception as e:
-        logger.debug(f"CTranslate2 CUDA check failed: {e}")
-
-    # Fallback: PyTorch CUDA
-    try:
-        import torch
-        if torch.cuda.is_available():
-            cuda_version = torch.version.cuda or "Unknown"
-            device_count = torch.cuda.device_count()
-            device_name = torch.cuda.get_device_name(0) if device_count > 0 else "Unknown"
-            logger.info(f"CUDA available (PyTorch) - Version: {cuda_version}, Devices: {device_count}, Device: {device_name}")
-            return True, f"CUDA {cuda_version} ({device_name})"
-    except ImportError:
-        pass
-    except Exception as e:
-        logger.debug(f"PyTorch CUDA check failed: {e}")
+        logger.debug("CTranslate2 CUDA check failed: %s", e)
 
     # GPU present but CUDA runtime missing - guide user
     gpu_name = _nvidia_gpu_name()
@@ -152,9 +211,17 @@ def _check_cuda_availability() -> tuple[bool, str]:
 def run_gui() -> None:
     """Initialize and run the GUI application."""
     try:
+        # The CUDA probe (CTranslate2 import, nvidia-smi) only does imports and a
+        # subprocess, so it runs in the background while Qt starts up
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cuda-probe")
+        cuda_future = executor.submit(_check_cuda_availability)
+        executor.shutdown(wait=False)
+        
         logger.info("Initializing QApplication...")
         app = QApplication(sys.argv)
-        app.setStyle('Fusion')
+        # Fusion is already the default on many Linux desktops; don't load it twice
+        if app.style().name().lower() != "fusion":
+            app.setStyle('Fusion')
         logger.debug("QApplication initialized with Fusion style")
         
         _install_sigint_handler()
@@ -170,13 +237,18 @@ def run_gui() -> None:
             )
             sys.exit(1)
         
-        cuda_ok, cuda_info = _check_cuda_availability()
+        # Imported only once dependencies are confirmed; this pulls in the whole
+        # widget tree (and overlaps with the CUDA probe)
+        from gui.main_window import MainWindow
+        
+        cuda_ok, cuda_info = cuda_future.result()
         logger.info(f"Device status: {cuda_info}")
         
         logger.info("Creating MainWindow...")
         window = MainWindow(cuda_available=cuda_ok)
         window.show()
         logger.info("MainWindow created and shown")
+        QTimer.singleShot(0, _log_debug_system_info)
         
         logger.info("Starting application event loop...")
         exit_code = app.exec()
@@ -205,6 +277,9 @@ def run_gui() -> None:
 
 def main() -> None:
     """Main entry point."""
+    # Silence the Intel OpenMP runtime's warnings (CTranslate2's CPU backend); must
+    # precede the first ctranslate2 import. A value set by the user still wins.
+    os.environ.setdefault("KMP_WARNINGS", "0")
     try:
         log_level = logging.DEBUG if "--debug" in sys.argv else logging.INFO
         log_file = setup_logging(level=log_level)
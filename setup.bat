@@ -127,8 +127,15 @@ goto end
 
 :search_python
 echo.
-echo Searching common locations for Python 3.11 and 3.12...
-powershell -NoProfile -Command "$paths = @('%%LocalAppData%%\\Programs\\Python\\Python312\\python.exe', '%%LocalAppData%%\\Programs\\Python\\Python311\\python.exe', 'C:\\Python312\\python.exe', 'C:\\Python311\\python.exe', '%%ProgramFiles%%\\Python312\\python.exe', '%%ProgramFiles%%\\Python311\\python.exe', '%%UserProfile%%\\AppData\\Local\\Programs\\Python\\Python312\\python.exe', '%%UserProfile%%\\AppData\\Local\\Programs\\Python\\Python311\\python.exe'); foreach ($p in $paths) { $exp = [Environment]::ExpandEnvironmentVariables($p); if (Test-Path $exp) { try { $v = & $exp -c 'import sys; print(sys.version_info.minor)' 2>$null; if ($v -match '^(11|12)$') { Write-Host 'FOUND:' $exp } } catch {} } }"
+echo Searching for installed Python 3.11 and 3.12...
+where py >nul 2>&1
+if %errorlevel% equ 0 (
+    py -0p 2>nul | findstr /R /C:"3\.1[12]"
+) else (
+    where python 2>nul
+    reg query "HKCU\SOFTWARE\Python\PythonCore" /s /v ExecutablePath 2>nul | findstr /I "python.exe"
+    reg query "HKLM\SOFTWARE\Python\PythonCore" /s /v ExecutablePath 2>nul | findstr /I "python.exe"
+)
 echo.
 echo If found above, use option [4] and paste the path.
 echo.